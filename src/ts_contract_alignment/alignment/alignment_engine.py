@@ -80,7 +80,9 @@ class AlignmentEngine(IAlignmentEngine):
         
         # Process each term
         for term in ts_result.terms:
-            term_matches = self._align_term(term, template_result.clauses)
+            term_matches = self._align_term(
+                term, template_result.clauses, template_result.keyword_index
+            )
             
             if term_matches:
                 # Take the best match
@@ -112,7 +114,8 @@ class AlignmentEngine(IAlignmentEngine):
     def _align_term(
         self,
         term: ExtractedTerm,
-        clauses: List[AnalyzedClause]
+        clauses: List[AnalyzedClause],
+        keyword_index: Optional[Dict[str, List[int]]] = None
     ) -> List[AlignmentMatch]:
         """
         Align a single term to clauses using rule-based then semantic matching.
@@ -120,6 +123,7 @@ class AlignmentEngine(IAlignmentEngine):
         Args:
             term: The extracted term to align.
             clauses: List of analyzed clauses.
+            keyword_index: Optional keyword -> clause index map for clauses.
             
         Returns:
             List of AlignmentMatch objects sorted by confidence.
@@ -127,7 +131,7 @@ class AlignmentEngine(IAlignmentEngine):
         matches: List[AlignmentMatch] = []
         
         # Try rule-based matching first
-        rule_matches = self._rule_matcher.match(term, clauses)
+        rule_matches = self._rule_matcher.match(term, clauses, keyword_index)
         
         for clause, method, confidence in rule_matches:
             match = self._create_match(term, clause, method, confidence)
@@ -265,7 +269,7 @@ class AlignmentEngine(IAlignmentEngine):
         segment: FillableSegment
     ) -> bool:
         """Check if term type is compatible with segment expected type."""
-        from ..models.template import FillableType
+        from ..models.enums import FillableType
         
         # Map term categories to expected fillable types
         category_to_types = {
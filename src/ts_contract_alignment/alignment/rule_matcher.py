@@ -183,7 +183,8 @@ class RuleBasedMatcher:
     def match(
         self,
         term: ExtractedTerm,
-        clauses: List[AnalyzedClause]
+        clauses: List[AnalyzedClause],
+        keyword_index: Optional[Dict[str, List[int]]] = None
     ) -> List[Tuple[AnalyzedClause, MatchMethod, float]]:
         """
         Find matching clauses for a term using rule-based matching.
@@ -191,14 +192,29 @@ class RuleBasedMatcher:
         Args:
             term: The extracted term to match.
             clauses: List of analyzed clauses to match against.
+            keyword_index: Optional keyword -> clause index map for
+                ``clauses`` (see TemplateAnalysisResult.keyword_index).
+                When given, each distinct keyword is tested against the
+                term once instead of once per clause.
             
         Returns:
             List of tuples (clause, match_method, confidence) sorted by confidence.
         """
         candidates: List[Tuple[AnalyzedClause, MatchMethod, float]] = []
         
-        for clause in clauses:
-            match_result = self._match_term_to_clause(term, clause)
+        keyword_hits: Optional[List[int]] = None
+        if keyword_index is not None:
+            keyword_hits = [0] * len(clauses)
+            term_text_lower = term.raw_text.lower()
+            for keyword, clause_indices in keyword_index.items():
+                if keyword in term_text_lower:
+                    for i in clause_indices:
+                        keyword_hits[i] += 1
+        
+        for i, clause in enumerate(clauses):
+            match_result = self._match_term_to_clause(
+                term, clause, None if keyword_hits is None else keyword_hits[i]
+            )
             if match_result:
                 method, confidence = match_result
                 candidates.append((clause, method, confidence))
@@ -210,7 +226,8 @@ class RuleBasedMatcher:
     def _match_term_to_clause(
         self,
         term: ExtractedTerm,
-        clause: AnalyzedClause
+        clause: AnalyzedClause,
+        keyword_hits: Optional[int] = None
     ) -> Optional[Tuple[MatchMethod, float]]:
         """
         Try to match a term to a clause using all available rules.
@@ -218,6 +235,8 @@ class RuleBasedMatcher:
         Args:
             term: The extracted term.
             clause: The analyzed clause.
+            keyword_hits: Precomputed count of clause keywords found in
+                the term text, if known.
             
         Returns:
             Tuple of (match_method, confidence) if matched, None otherwise.
@@ -238,7 +257,7 @@ class RuleBasedMatcher:
             return (MatchMethod.RULE_KEYWORD, keyword_confidence)
         
         # Try category-based matching
-        category_confidence = self._match_by_category(term, clause)
+        category_confidence = self._match_by_category(term, clause, keyword_hits)
         if category_confidence > 0.4:
             return (MatchMethod.RULE_KEYWORD, category_confidence)
         
@@ -404,7 +423,8 @@ class RuleBasedMatcher:
     def _match_by_category(
         self,
         term: ExtractedTerm,
-        clause: AnalyzedClause
+        clause: AnalyzedClause,
+        keyword_hits: Optional[int] = None
     ) -> float:
         """
         Match term to clause by category mapping.
@@ -412,6 +432,8 @@ class RuleBasedMatcher:
         Args:
             term: The extracted term.
             clause: The analyzed clause.
+            keyword_hits: Precomputed count of clause keywords found in
+                the term text; counted here when not given.
             
         Returns:
             Confidence score (0.0 to 1.0).
@@ -423,15 +445,13 @@ class RuleBasedMatcher:
             base_confidence = 0.6
             
             # Boost confidence if there's keyword overlap
-            term_text_lower = term.raw_text.lower()
-            clause_keywords_lower = [k.lower() for k in clause.keywords]
-            
-            keyword_boost = 0.0
-            for keyword in clause_keywords_lower:
-                if keyword in term_text_lower:
-                    keyword_boost += 0.05
+            if keyword_hits is None:
+                term_text_lower = term.raw_text.lower()
+                keyword_hits = sum(
+                    1 for k in clause.keywords if k.lower() in term_text_lower
+                )
             
-            return min(0.8, base_confidence + keyword_boost)
+            return min(0.8, base_confidence + 0.05 * keyword_hits)
         
         return 0.0
 
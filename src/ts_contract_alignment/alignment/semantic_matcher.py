@@ -4,7 +4,9 @@ This module implements semantic matching using sentence embeddings
 to align TS terms with contract clauses when rule-based matching fails.
 """
 
+import math
 from dataclasses import dataclass
+from operator import mul
 from typing import Any, List, Optional, Tuple
 
 from ..models.enums import MatchMethod
@@ -123,18 +125,20 @@ class SemanticMatcher:
         """
         results: List[Tuple[AnalyzedClause, MatchMethod, float]] = []
         
+        # The term's norm is the same for every clause; compute it once
+        term_norm = math.hypot(*term_embedding)
+        
         for clause in clauses:
             # Use pre-computed embedding if available
-            if clause.semantic_embedding is not None:
-                similarity = self._cosine_similarity(
-                    term_embedding, clause.semantic_embedding
-                )
-            else:
+            clause_embedding = clause.semantic_embedding
+            if clause_embedding is None:
                 # Generate embedding on the fly
                 clause_embedding = self._generate_embedding(clause.full_text)
                 if clause_embedding is None:
                     continue
-                similarity = self._cosine_similarity(term_embedding, clause_embedding)
+            similarity = self._cosine_similarity(
+                term_embedding, clause_embedding, term_norm
+            )
             
             if similarity >= self._similarity_threshold:
                 results.append((clause, MatchMethod.SEMANTIC, similarity))
@@ -205,7 +209,8 @@ class SemanticMatcher:
     def _cosine_similarity(
         self,
         vec1: List[float],
-        vec2: List[float]
+        vec2: List[float],
+        norm1: Optional[float] = None,
     ) -> float:
         """
         Compute cosine similarity between two vectors.
@@ -213,6 +218,7 @@ class SemanticMatcher:
         Args:
             vec1: First vector.
             vec2: Second vector.
+            norm1: Precomputed Euclidean norm of vec1, if known.
             
         Returns:
             Cosine similarity score (0.0 to 1.0).
@@ -220,9 +226,11 @@ class SemanticMatcher:
         if len(vec1) != len(vec2):
             return 0.0
         
-        dot_product = sum(a * b for a, b in zip(vec1, vec2))
-        norm1 = sum(a * a for a in vec1) ** 0.5
-        norm2 = sum(b * b for b in vec2) ** 0.5
+        # map/hypot keep the per-element arithmetic in C
+        dot_product = sum(map(mul, vec1, vec2))
+        if norm1 is None:
+            norm1 = math.hypot(*vec1)
+        norm2 = math.hypot(*vec2)
         
         if norm1 == 0 or norm2 == 0:
             return 0.0
@@ -396,7 +396,7 @@ class TemplateAnalyzer(ITemplateAnalyzer):
         return TemplateAnalysisResult(
             document_id=data["document_id"],
             clauses=[self._dict_to_clause(c) for c in data.get("clauses", [])],
-            structure_map=data.get("structure_map", {}),
+            structure_map=data.get("structure_map") or {},
             analysis_timestamp=data.get("analysis_timestamp", ""),
         )
 
@@ -434,7 +434,7 @@ class TemplateAnalyzer(ITemplateAnalyzer):
             fillable_segments=[
                 self._dict_to_segment(s) for s in data.get("fillable_segments", [])
             ],
-            keywords=data.get("keywords", []),
+            keywords=data.get("keywords") or [],
             semantic_embedding=data.get("semantic_embedding"),
         )
 
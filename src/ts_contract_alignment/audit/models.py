@@ -169,6 +169,8 @@ class AuditEventModel(Base):
         Index("idx_audit_events_timestamp", "timestamp"),
         Index("idx_audit_events_document_id", "document_id"),
         Index("idx_audit_events_user_id", "user_id"),
+        # Serves get_events() filtered by document and type, newest first
+        Index("idx_audit_events_doc_type_ts", "document_id", "event_type", "timestamp"),
     )
 
 
@@ -42,13 +42,13 @@ class TSExtractor(ITSExtractor):
         terms: List[ExtractedTerm] = []
         unrecognized_sections: List[str] = []
         
-        # Process all sections recursively
-        for section in parsed_doc.sections:
-            section_terms, section_unrecognized = self._process_section(
-                section, parsed_doc.id
-            )
-            terms.extend(section_terms)
-            unrecognized_sections.extend(section_unrecognized)
+        # Process all sections, nested ones included, in document order
+        for section in parsed_doc.iter_sections():
+            term, unrecognized = self._process_section(section, parsed_doc.id)
+            if term:
+                terms.append(term)
+            elif unrecognized:
+                unrecognized_sections.append(section.id)
         
         # Ensure unique IDs
         self._ensure_unique_ids(terms)
@@ -62,11 +62,14 @@ class TSExtractor(ITSExtractor):
 
     def _process_section(
         self, section: DocumentSection, doc_id: str
-    ) -> tuple[List[ExtractedTerm], List[str]]:
-        """Process a document section and extract terms."""
-        terms: List[ExtractedTerm] = []
-        unrecognized: List[str] = []
+    ) -> tuple[Optional[ExtractedTerm], bool]:
+        """
+        Extract a term from a single section, without its children.
         
+        Returns:
+            Tuple of (extracted term or None, whether the section is an
+            unrecognized titled section).
+        """
         # Combine section title and content for analysis
         section_text = self._get_section_text(section)
         
@@ -77,19 +80,10 @@ class TSExtractor(ITSExtractor):
             term = self._create_term_from_section(
                 section, category, confidence, doc_id
             )
-            if term:
-                terms.append(term)
-        elif section.title and section_text.strip():
-            # Section couldn't be categorized
-            unrecognized.append(section.id)
-        
-        # Process child sections recursively
-        for child in section.children:
-            child_terms, child_unrecognized = self._process_section(child, doc_id)
-            terms.extend(child_terms)
-            unrecognized.extend(child_unrecognized)
+            return term, False
         
-        return terms, unrecognized
+        # Section couldn't be categorized
+        return None, bool(section.title and section_text.strip())
 
     def _get_section_text(self, section: DocumentSection) -> str:
         """Get combined text from a section."""
@@ -215,7 +209,7 @@ class TSExtractor(ITSExtractor):
         return TSExtractionResult(
             document_id=data["document_id"],
             terms=[self._dict_to_term(t) for t in data.get("terms", [])],
-            unrecognized_sections=data.get("unrecognized_sections", []),
+            unrecognized_sections=data.get("unrecognized_sections") or [],
             extraction_timestamp=data.get("extraction_timestamp", ""),
         )
 
@@ -255,5 +249,5 @@ class TSExtractor(ITSExtractor):
             source_section_id=data["source_section_id"],
             source_paragraph_id=data["source_paragraph_id"],
             confidence=data["confidence"],
-            metadata=data.get("metadata", {}),
+            metadata=data.get("metadata") or {},
         )
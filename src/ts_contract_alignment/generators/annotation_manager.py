@@ -19,6 +19,14 @@ from ..models.enums import ActionType
 
 logger = logging.getLogger(__name__)
 
+# Inline annotation formatting shared by the generator and the exporter;
+# RGBColor and Pt lengths are immutable
+ANNOTATION_COLOR = RGBColor(128, 128, 128)
+ANNOTATION_SIZE = Pt(8)
+
+# Upper-cased action labels used in annotations
+ACTION_LABEL = {action: action.value.upper() for action in ActionType}
+
 
 class AnnotationStyle(Enum):
     """Styles for displaying annotations."""
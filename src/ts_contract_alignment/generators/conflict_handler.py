@@ -1,17 +1,44 @@
 """Conflict handling for contract generation."""
 
 import logging
+import time
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 from ..interfaces.generator import Modification
 from ..models.enums import ActionType
 
+try:  # Optional accelerator for batch substring search
+    import ahocorasick
+except ImportError:  # pragma: no cover - depends on environment
+    ahocorasick = None
+
 
 logger = logging.getLogger(__name__)
 
+# Conflicts are usually recorded in bursts; reuse the formatted timestamp
+# for records created within the same millisecond. The (ns, str) pair is
+# replaced as one tuple so concurrent callers never see a mismatched pair.
+_LAST_TS: Tuple[int, str] = (0, "")
+
+
+def _fast_ts() -> str:
+    """Return the current UTC time as an ISO string, cached per millisecond."""
+    global _LAST_TS
+    last_ns, last_str = _LAST_TS
+    now = time.time_ns()
+    if now - last_ns <= 1_000_000:
+        return last_str
+    formatted = (
+        datetime.fromtimestamp(now / 1e9, timezone.utc)
+        .replace(tzinfo=None)
+        .isoformat()
+    )
+    _LAST_TS = (now, formatted)
+    return formatted
+
 
 class ConflictType(Enum):
     """Types of conflicts that can occur during generation."""
@@ -33,29 +60,43 @@ class ConflictResolution(Enum):
     MANUAL_REVIEW = "manual_review"
 
 
-@dataclass
+@dataclass(slots=True)
 class ConflictRecord:
     """Record of a conflict during contract generation."""
     id: str
     modification_id: str
     conflict_type: ConflictType
-    description: str
+    # Either a formatted string or a (template, args) pair that is only
+    # formatted when the description is actually read.
+    description: Union[str, Tuple[str, tuple]]
     original_value: Any
     attempted_value: Any
     resolution: ConflictResolution
     resolution_details: str
-    timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    timestamp: str = field(default_factory=_fast_ts)
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    @property
+    def description_str(self) -> str:
+        """The description as a string, formatting it on first access."""
+        description = self.description
+        if not isinstance(description, str):
+            template, args = description
+            description = template.format(*args)
+            self.description = description
+        return description
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
+        original = self.original_value
+        attempted = self.attempted_value
         return {
             "id": self.id,
             "modification_id": self.modification_id,
             "conflict_type": self.conflict_type.value,
-            "description": self.description,
-            "original_value": str(self.original_value),
-            "attempted_value": str(self.attempted_value),
+            "description": self.description_str,
+            "original_value": original if type(original) is str else str(original),
+            "attempted_value": attempted if type(attempted) is str else str(attempted),
             "resolution": self.resolution.value,
             "resolution_details": self.resolution_details,
             "timestamp": self.timestamp,
@@ -63,7 +104,7 @@ class ConflictRecord:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ConflictHandlerConfig:
     """Configuration for conflict handling."""
     default_resolution: ConflictResolution = ConflictResolution.PRESERVE_ORIGINAL
@@ -96,6 +137,12 @@ class ConflictHandler:
         self.config = config or ConflictHandlerConfig()
         self.conflicts: List[ConflictRecord] = []
         self._conflict_count = 0
+        # Indexes maintained by _record_conflict so per-type queries and
+        # reporting do not need to rescan self.conflicts.
+        self._by_type: Dict[ConflictType, List[ConflictRecord]] = {
+            ct: [] for ct in ConflictType
+        }
+        self._review_list: List[ConflictRecord] = []
 
     def detect_formatting_conflict(
         self,
@@ -114,15 +161,17 @@ class ConflictHandler:
         Returns:
             ConflictRecord if conflict detected, None otherwise.
         """
-        conflicts_found = []
+        # Only attributes present in both formats can conflict
+        common = original_format.keys() & target_format.keys()
+        if not common:
+            return None
         
-        # Check each formatting attribute
-        for key in original_format:
-            if key in target_format:
-                if original_format[key] != target_format[key]:
-                    conflicts_found.append(
-                        f"{key}: {original_format[key]} -> {target_format[key]}"
-                    )
+        # Walk original_format to keep the description order stable
+        conflicts_found = [
+            f"{key}: {original_format[key]} -> {target_format[key]}"
+            for key in original_format
+            if key in common and original_format[key] != target_format[key]
+        ]
         
         if not conflicts_found:
             return None
@@ -130,7 +179,7 @@ class ConflictHandler:
         return self._create_conflict(
             modification=modification,
             conflict_type=ConflictType.FORMATTING_MISMATCH,
-            description=f"Formatting mismatch: {', '.join(conflicts_found)}",
+            description=("Formatting mismatch: {}", (", ".join(conflicts_found),)),
             original_value=original_format,
             attempted_value=target_format,
         )
@@ -150,18 +199,19 @@ class ConflictHandler:
         Returns:
             ConflictRecord if overlap detected, None otherwise.
         """
+        start = modification.location_start
+        end = modification.location_end
+        
         for existing in existing_modifications:
-            # Check for location overlap
-            if self._locations_overlap(
-                modification.location_start,
-                modification.location_end,
-                existing.location_start,
-                existing.location_end,
-            ):
+            # Half-open ranges overlap unless one ends before the other starts
+            if existing.location_end > start and end > existing.location_start:
                 return self._create_conflict(
                     modification=modification,
                     conflict_type=ConflictType.OVERLAPPING_MODIFICATION,
-                    description=f"Modification overlaps with existing modification {existing.id}",
+                    description=(
+                        "Modification overlaps with existing modification {}",
+                        (existing.id,),
+                    ),
                     original_value=existing.new_text,
                     attempted_value=modification.new_text,
                 )
@@ -184,16 +234,64 @@ class ConflictHandler:
             ConflictRecord if location not found, None otherwise.
         """
         if modification.original_text and modification.original_text not in document_text:
-            return self._create_conflict(
-                modification=modification,
-                conflict_type=ConflictType.LOCATION_NOT_FOUND,
-                description=f"Target text not found in document: '{modification.original_text[:50]}...'",
-                original_value=modification.original_text,
-                attempted_value=modification.new_text,
-            )
+            return self._create_location_not_found(modification)
         
         return None
 
+    def detect_location_not_found_batch(
+        self,
+        modifications: List[Modification],
+        document_text: str,
+    ) -> List[Optional[ConflictRecord]]:
+        """
+        Detect missing target locations for many modifications at once.
+        
+        When ``pyahocorasick`` is installed, all target snippets are
+        located in a single sweep over the document; otherwise each
+        distinct snippet is searched once.
+        
+        Args:
+            modifications: The modifications to apply.
+            document_text: The full document text.
+            
+        Returns:
+            One entry per modification: a ConflictRecord if its location
+            was not found, None otherwise.
+        """
+        snippets = {m.original_text for m in modifications if m.original_text}
+        found = self._find_snippets(snippets, document_text)
+        
+        return [
+            self._create_location_not_found(m)
+            if m.original_text and m.original_text not in found
+            else None
+            for m in modifications
+        ]
+
+    def _find_snippets(self, snippets: Set[str], document_text: str) -> Set[str]:
+        """Return the subset of snippets that occur in the document text."""
+        if ahocorasick is None or len(snippets) < 2:
+            return {snippet for snippet in snippets if snippet in document_text}
+        
+        automaton = ahocorasick.Automaton()
+        for snippet in snippets:
+            automaton.add_word(snippet, snippet)
+        automaton.make_automaton()
+        return {snippet for _, snippet in automaton.iter(document_text)}
+
+    def _create_location_not_found(self, modification: Modification) -> ConflictRecord:
+        """Create a LOCATION_NOT_FOUND conflict for a modification."""
+        return self._create_conflict(
+            modification=modification,
+            conflict_type=ConflictType.LOCATION_NOT_FOUND,
+            description=(
+                "Target text not found in document: '{:.50}...'",
+                (modification.original_text,),
+            ),
+            original_value=modification.original_text,
+            attempted_value=modification.new_text,
+        )
+
     def detect_structure_violation(
         self,
         modification: Modification,
@@ -223,28 +321,21 @@ class ConflictHandler:
                 return self._create_conflict(
                     modification=modification,
                     conflict_type=ConflictType.STRUCTURE_VIOLATION,
-                    description=f"Modification may break document structure (removing '{pattern}')",
+                    description=(
+                        "Modification may break document structure (removing '{}')",
+                        (pattern,),
+                    ),
                     original_value=modification.original_text,
                     attempted_value=modification.new_text,
                 )
         
         return None
 
-    def _locations_overlap(
-        self,
-        start1: int,
-        end1: int,
-        start2: int,
-        end2: int,
-    ) -> bool:
-        """Check if two location ranges overlap."""
-        return not (end1 <= start2 or end2 <= start1)
-
     def _create_conflict(
         self,
         modification: Modification,
         conflict_type: ConflictType,
-        description: str,
+        description: Union[str, Tuple[str, tuple]],
         original_value: Any,
         attempted_value: Any,
     ) -> ConflictRecord:
@@ -335,11 +426,16 @@ class ConflictHandler:
         """Record a conflict and handle logging."""
         self.conflicts.append(conflict)
         self._conflict_count += 1
+        self._by_type[conflict.conflict_type].append(conflict)
+        if conflict.resolution is ConflictResolution.MANUAL_REVIEW:
+            self._review_list.append(conflict)
         
-        if self.config.log_all_conflicts:
+        if self.config.log_all_conflicts and logger.isEnabledFor(logging.WARNING):
             logger.warning(
-                f"Conflict detected: {conflict.conflict_type.value} - "
-                f"{conflict.description} (Resolution: {conflict.resolution.value})"
+                "Conflict detected: %s - %s (Resolution: %s)",
+                conflict.conflict_type.value,
+                conflict.description_str,
+                conflict.resolution.value,
             )
         
         if self._conflict_count >= self.config.max_conflicts_before_abort:
@@ -348,8 +444,8 @@ class ConflictHandler:
                     f"Maximum conflict count ({self.config.max_conflicts_before_abort}) exceeded"
                 )
             logger.error(
-                f"Maximum conflict count exceeded. "
-                f"Total conflicts: {self._conflict_count}"
+                "Maximum conflict count exceeded. Total conflicts: %d",
+                self._conflict_count,
             )
 
     def resolve_conflict(
@@ -383,42 +479,38 @@ class ConflictHandler:
 
     def _merge_values(self, original: Any, new: Any) -> Any:
         """Attempt to merge two values."""
+        # Formatting dicts are the common merge case, so check them first
         if isinstance(original, dict) and isinstance(new, dict):
-            merged = original.copy()
-            merged.update(new)
-            return merged
-        elif isinstance(original, str) and isinstance(new, str):
-            return f"{original} {new}"
-        else:
-            return new
+            return original | new
+        if isinstance(original, str) and isinstance(new, str):
+            return " ".join((original, new))
+        return new
 
-    def get_conflicts(self) -> List[ConflictRecord]:
-        """Get all recorded conflicts."""
-        return self.conflicts.copy()
+    def get_conflicts(self) -> Tuple[ConflictRecord, ...]:
+        """Get an immutable copy of all recorded conflicts."""
+        return tuple(self.conflicts)
+
+    def snapshot(self) -> List[ConflictRecord]:
+        """Get a mutable copy of all recorded conflicts."""
+        return list(self.conflicts)
 
     def get_conflicts_by_type(
         self,
         conflict_type: ConflictType,
     ) -> List[ConflictRecord]:
         """Get conflicts filtered by type."""
-        return [c for c in self.conflicts if c.conflict_type == conflict_type]
+        return list(self._by_type[conflict_type])
 
     def get_conflicts_requiring_review(self) -> List[ConflictRecord]:
         """Get conflicts that require manual review."""
-        return [
-            c for c in self.conflicts
-            if c.resolution == ConflictResolution.MANUAL_REVIEW
-        ]
+        return list(self._review_list)
 
     def export_conflict_report(self) -> Dict[str, Any]:
         """Export a summary report of all conflicts."""
         return {
             "total_conflicts": len(self.conflicts),
-            "by_type": {
-                ct.value: len(self.get_conflicts_by_type(ct))
-                for ct in ConflictType
-            },
-            "requiring_review": len(self.get_conflicts_requiring_review()),
+            "by_type": {ct.value: len(records) for ct, records in self._by_type.items()},
+            "requiring_review": len(self._review_list),
             "conflicts": [c.to_dict() for c in self.conflicts],
         }
 
@@ -426,3 +518,5 @@ class ConflictHandler:
         """Clear all recorded conflicts."""
         self.conflicts = []
         self._conflict_count = 0
+        self._by_type = {ct: [] for ct in ConflictType}
+        self._review_list = []
@@ -1,21 +1,25 @@
 """Contract generator implementation for the TS Contract Alignment System."""
 
 import copy
+import io
 import logging
 import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from docx import Document
 from docx.enum.text import WD_COLOR_INDEX
 from docx.oxml import OxmlElement
 from docx.oxml.ns import qn
-from docx.shared import Pt, RGBColor
 from docx.text.paragraph import Paragraph
 from docx.text.run import Run
 
+from ..ids import new_id
 from ..interfaces.generator import (
     GeneratedContract,
     IContractGenerator,
@@ -23,15 +27,38 @@ from ..interfaces.generator import (
 )
 from ..models.alignment import AlignmentMatch, AlignmentResult
 from ..models.document import DocumentSection, ParsedDocument, TextSegment
-from ..models.enums import ActionType
+from ..models.enums import ActionType, TermCategory
 from ..models.extraction import ExtractedTerm, TSExtractionResult
 from ..models.template import AnalyzedClause, FillableSegment, TemplateAnalysisResult
+from .annotation_manager import ACTION_LABEL, ANNOTATION_COLOR, ANNOTATION_SIZE
 from .conflict_handler import ConflictHandler, ConflictHandlerConfig, ConflictType
+from .paragraph_index import ParagraphIndex
 
 
 logger = logging.getLogger(__name__)
 
 
+def _format_usd(value: float) -> str:
+    return f"USD {value:,.2f}"
+
+
+def _format_multiple(value: float) -> str:
+    return f"{value:.2f}x"
+
+
+def _format_plain_number(value: float) -> str:
+    return f"{value:,.2f}"
+
+
+# Numeric formatting per term category; anything else uses _format_plain_number
+_NUMBER_FORMATTERS: Dict[TermCategory, Callable[[float], str]] = {
+    TermCategory.INVESTMENT_AMOUNT: _format_usd,
+    TermCategory.VALUATION: _format_usd,
+    TermCategory.LIQUIDATION_PREFERENCE: _format_multiple,
+    TermCategory.ANTI_DILUTION: _format_multiple,
+}
+
+
 @dataclass
 class ConflictRecord:
     """Record of a formatting conflict during generation."""
@@ -77,6 +104,7 @@ class ContractGenerator(IContractGenerator):
         output_dir: str = "data/generated",
         annotation_config: Optional[AnnotationConfig] = None,
         conflict_config: Optional[ConflictHandlerConfig] = None,
+        parallel_export: bool = True,
     ):
         """
         Initialize the contract generator.
@@ -85,12 +113,21 @@ class ContractGenerator(IContractGenerator):
             output_dir: Directory for generated contract files.
             annotation_config: Configuration for annotations.
             conflict_config: Configuration for conflict handling.
+            parallel_export: Whether export_both_versions builds the two
+                documents concurrently.
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.annotation_config = annotation_config or AnnotationConfig()
         self.conflict_handler = ConflictHandler(conflict_config)
         self.conflicts: List[ConflictRecord] = []
+        self._parallel_export = parallel_export
+        # Inline annotation format string, rebuilt when the show_* flags change
+        self._annotation_template_key: Optional[Tuple[bool, bool, bool]] = None
+        self._annotation_template = ""
+        # Clause ID -> (original_text, start, end) for the template being
+        # generated; rebuilt at the start of every generate() call.
+        self._clause_index: Dict[str, Tuple[str, int, int]] = {}
 
     def generate(
         self,
@@ -111,29 +148,41 @@ class ContractGenerator(IContractGenerator):
         """
         self.conflicts = []  # Reset conflicts for new generation
         self.conflict_handler.clear_conflicts()  # Reset conflict handler
+        self._clause_index = self._build_clause_index(template_doc)
         
         contract_id = str(uuid.uuid4())
-        modifications: List[Modification] = []
+        now = datetime.utcnow()
+        now_iso = now.isoformat()
         
         # Build lookup maps for efficient access
         terms_by_id = {term.id: term for term in ts_result.terms}
+        active_matches = [
+            m for m in alignment_result.matches if m.action is not ActionType.SKIP
+        ]
+        
+        missing_term_ids = {m.ts_term_id for m in active_matches} - terms_by_id.keys()
+        if missing_term_ids:
+            logger.warning(
+                "Terms not found for matches: %s", ", ".join(sorted(missing_term_ids))
+            )
         
-        # Process each alignment match
-        for match in alignment_result.matches:
-            if match.action == ActionType.SKIP:
-                continue
-                
-            term = terms_by_id.get(match.ts_term_id)
-            if not term:
-                logger.warning(f"Term not found for match: {match.ts_term_id}")
-                continue
-            
-            modification = self._create_modification(match, term, template_doc)
-            if modification:
-                modifications.append(modification)
+        # Process each alignment match that has a known term
+        pairs = [
+            (m, terms_by_id[m.ts_term_id])
+            for m in active_matches
+            if m.ts_term_id in terms_by_id
+        ]
+        modifications: List[Modification] = [
+            mod
+            for mod in (
+                self._create_modification(match, term, template_doc, now_iso, new_id())
+                for match, term in pairs
+            )
+            if mod
+        ]
         
         # Generate file paths
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         base_name = f"contract_{contract_id[:8]}_{timestamp}"
         revision_path = str(self.output_dir / f"{base_name}_tracked.docx")
         clean_path = str(self.output_dir / f"{base_name}_clean.docx")
@@ -145,7 +194,7 @@ class ContractGenerator(IContractGenerator):
             modifications=modifications,
             revision_tracked_path=revision_path,
             clean_version_path=clean_path,
-            generation_timestamp=datetime.utcnow().isoformat(),
+            generation_timestamp=now_iso,
         )
 
     def _create_modification(
@@ -153,6 +202,8 @@ class ContractGenerator(IContractGenerator):
         match: AlignmentMatch,
         term: ExtractedTerm,
         template_doc: ParsedDocument,
+        now_iso: Optional[str] = None,
+        modification_id: Optional[str] = None,
     ) -> Optional[Modification]:
         """
         Create a modification record for a single alignment match.
@@ -161,6 +212,8 @@ class ContractGenerator(IContractGenerator):
             match: The alignment match.
             term: The extracted TS term.
             template_doc: The template document.
+            now_iso: Shared annotation timestamp; defaults to the current time.
+            modification_id: Pre-generated ID; a new UUID4 is used if omitted.
             
         Returns:
             Modification record or None if creation fails.
@@ -174,10 +227,10 @@ class ContractGenerator(IContractGenerator):
         new_text = self._format_term_value(term)
         
         # Build annotations
-        annotations = self._build_annotations(match, term)
+        annotations = self._build_annotations(match, term, now_iso)
         
         return Modification(
-            id=str(uuid.uuid4()),
+            id=modification_id or str(uuid.uuid4()),
             match_id=match.id,
             original_text=original_text,
             new_text=new_text,
@@ -204,53 +257,41 @@ class ContractGenerator(IContractGenerator):
         Returns:
             Tuple of (original_text, start_position, end_position).
         """
-        # Search through sections to find the matching clause
-        for section in template_doc.sections:
-            result = self._search_section_for_clause(section, match.clause_id)
-            if result:
-                return result
-            
-            # Search children recursively
-            for child in section.children:
-                result = self._search_section_recursive(child, match.clause_id)
-                if result:
-                    return result
+        if self._clause_index:
+            return self._clause_index.get(match.clause_id, ("", 0, 0))
+        
+        # No index built (called outside generate); search in document order
+        for section in template_doc.iter_sections():
+            if section.id == match.clause_id:
+                return self._section_location(section)
         
         # Default: return empty location if not found
         return "", 0, 0
 
-    def _search_section_for_clause(
-        self,
-        section: DocumentSection,
-        clause_id: str,
-    ) -> Optional[Tuple[str, int, int]]:
-        """Search a section for a clause ID."""
-        if section.id == clause_id:
-            # Found the section - return its content
-            if section.segments:
-                first_seg = section.segments[0]
-                last_seg = section.segments[-1]
-                content = " ".join(seg.content for seg in section.segments)
-                return content, first_seg.start_pos, last_seg.end_pos
-            return section.title or "", 0, 0
-        return None
-
-    def _search_section_recursive(
+    def _build_clause_index(
         self,
-        section: DocumentSection,
-        clause_id: str,
-    ) -> Optional[Tuple[str, int, int]]:
-        """Recursively search sections for a clause ID."""
-        result = self._search_section_for_clause(section, clause_id)
-        if result:
-            return result
-        
-        for child in section.children:
-            result = self._search_section_recursive(child, clause_id)
-            if result:
-                return result
+        template_doc: ParsedDocument,
+    ) -> Dict[str, Tuple[str, int, int]]:
+        """
+        Map every section ID in the template to its target location.
         
-        return None
+        Sections are visited in document (pre-)order and the first section
+        with a given ID wins, matching the fallback search.
+        """
+        index: Dict[str, Tuple[str, int, int]] = {}
+        for section in template_doc.iter_sections():
+            if section.id not in index:
+                index[section.id] = self._section_location(section)
+        return index
+
+    def _section_location(self, section: DocumentSection) -> Tuple[str, int, int]:
+        """Get the (original_text, start, end) location of a section."""
+        if section.segments:
+            first_seg = section.segments[0]
+            last_seg = section.segments[-1]
+            content = " ".join(seg.content for seg in section.segments)
+            return content, first_seg.start_pos, last_seg.end_pos
+        return section.title or "", 0, 0
 
     def _format_term_value(self, term: ExtractedTerm) -> str:
         """
@@ -287,21 +328,13 @@ class ContractGenerator(IContractGenerator):
 
     def _format_number(self, value: float, category: Any) -> str:
         """Format a numeric value based on category."""
-        from ..models.enums import TermCategory
-        
-        if category == TermCategory.INVESTMENT_AMOUNT:
-            return f"USD {value:,.2f}"
-        elif category == TermCategory.VALUATION:
-            return f"USD {value:,.2f}"
-        elif category in (TermCategory.LIQUIDATION_PREFERENCE, TermCategory.ANTI_DILUTION):
-            return f"{value:.2f}x"
-        else:
-            return f"{value:,.2f}"
+        return _NUMBER_FORMATTERS.get(category, _format_plain_number)(value)
 
     def _build_annotations(
         self,
         match: AlignmentMatch,
         term: ExtractedTerm,
+        now_iso: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Build annotation dictionary for a modification.
@@ -309,22 +342,24 @@ class ContractGenerator(IContractGenerator):
         Args:
             match: The alignment match.
             term: The extracted term.
+            now_iso: Shared annotation timestamp; defaults to the current time.
             
         Returns:
             Dictionary of annotation data.
         """
+        config = self.annotation_config
         annotations = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": now_iso or datetime.utcnow().isoformat(),
         }
         
-        if self.annotation_config.show_source_id:
+        if config.show_source_id:
             annotations["source_ts_paragraph_id"] = term.source_paragraph_id
             annotations["source_section_id"] = term.source_section_id
         
-        if self.annotation_config.show_action_type:
+        if config.show_action_type:
             annotations["action_type"] = match.action.value
         
-        if self.annotation_config.show_confidence:
+        if config.show_confidence:
             annotations["confidence_score"] = match.confidence
         
         annotations["match_method"] = match.match_method.value
@@ -352,15 +387,20 @@ class ContractGenerator(IContractGenerator):
         """
         doc = Document(source_path)
         
-        # Sort modifications by location (reverse order to preserve positions)
-        sorted_mods = sorted(
-            modifications,
-            key=lambda m: m.location_start,
-            reverse=True,
-        )
+        index = ParagraphIndex(doc.paragraphs, (m.original_text for m in modifications))
+        
+        # Group modifications by target paragraph; unlocated ones go last
+        groups: Dict[Optional[int], List[Modification]] = defaultdict(list)
+        for mod in modifications:
+            groups[index.find(mod.original_text)].append(mod)
         
-        for mod in sorted_mods:
-            self._apply_single_modification(doc, mod, with_annotations)
+        by_start = attrgetter("location_start")
+        for position in sorted(groups, key=lambda p: (p is None, p or 0)):
+            bucket = groups[position]
+            # Reverse location order within a paragraph preserves positions
+            bucket.sort(key=by_start, reverse=True)
+            for mod in bucket:
+                self._apply_single_modification(doc, mod, with_annotations, index)
         
         return doc
 
@@ -369,6 +409,7 @@ class ContractGenerator(IContractGenerator):
         doc: Document,
         mod: Modification,
         with_annotations: bool,
+        index: ParagraphIndex,
     ) -> None:
         """
         Apply a single modification to the document.
@@ -377,25 +418,32 @@ class ContractGenerator(IContractGenerator):
             doc: The Document object.
             mod: The modification to apply.
             with_annotations: Whether to add annotations.
+            index: Paragraph index over the document being modified.
         """
         # Find the paragraph containing the modification
-        for para in doc.paragraphs:
-            if mod.original_text and mod.original_text in para.text:
-                try:
-                    self._modify_paragraph(para, mod, with_annotations)
-                    return
-                except Exception as e:
-                    # Record conflict and preserve original
-                    self._record_conflict(mod, "modification_failed", str(e))
-                    return
+        position = index.find(mod.original_text)
+        if position is not None:
+            try:
+                self._modify_paragraph(
+                    index.paragraphs[position],
+                    index.texts[position],
+                    mod,
+                    with_annotations,
+                )
+            except Exception as e:
+                # Record conflict and preserve original
+                self._record_conflict(mod, "modification_failed", str(e))
+            index.refresh(position)
+            return
         
         # If original text not found, try to append to appropriate section
         if mod.action == ActionType.INSERT:
-            self._insert_new_content(doc, mod, with_annotations)
+            index.append(self._insert_new_content(doc, mod, with_annotations))
 
     def _modify_paragraph(
         self,
         para: Paragraph,
+        text: str,
         mod: Modification,
         with_annotations: bool,
     ) -> None:
@@ -404,14 +452,27 @@ class ContractGenerator(IContractGenerator):
         
         Args:
             para: The paragraph to modify.
+            text: The paragraph's current text.
             mod: The modification details.
             with_annotations: Whether to add annotations.
         """
-        original_formatting = self._capture_formatting(para)
-        
         if mod.action == ActionType.OVERRIDE:
-            # Replace the original text with new text
-            new_text = para.text.replace(mod.original_text, mod.new_text)
+            # Edit the run in place when it holds every occurrence of the
+            # original text; this keeps all run formatting untouched
+            occurrences = text.count(mod.original_text)
+            for run in para.runs:
+                run_text = run.text
+                if run_text.count(mod.original_text) == occurrences:
+                    run.text = run_text.replace(mod.original_text, mod.new_text)
+                    if with_annotations:
+                        self._add_modification_highlight(run, mod)
+                        if self.annotation_config.annotation_style == "inline":
+                            self._add_inline_annotation(para, mod)
+                    return
+            
+            # Original text spans runs: rebuild the paragraph as one run
+            original_formatting = self._capture_formatting(para)
+            new_text = text.replace(mod.original_text, mod.new_text)
             self._set_paragraph_text_with_formatting(
                 para, new_text, original_formatting, mod, with_annotations
             )
@@ -500,24 +561,37 @@ class ContractGenerator(IContractGenerator):
 
     def _add_inline_annotation(self, para: Paragraph, mod: Modification) -> None:
         """Add inline annotation text after the modification."""
-        annotation_parts = []
-        
-        if self.annotation_config.show_source_id:
-            annotation_parts.append(f"[TS:{mod.source_ts_paragraph_id}]")
-        
-        if self.annotation_config.show_action_type:
-            annotation_parts.append(f"[{mod.action.value.upper()}]")
-        
-        if self.annotation_config.show_confidence:
-            annotation_parts.append(f"[Conf:{mod.confidence:.2f}]")
-        
-        if annotation_parts:
-            annotation_text = " " + " ".join(annotation_parts)
+        template = self._inline_annotation_template()
+        
+        if template:
+            annotation_text = template.format_map({
+                "source": mod.source_ts_paragraph_id,
+                "action": ACTION_LABEL[mod.action],
+                "confidence": mod.confidence,
+            })
             annotation_run = para.add_run(annotation_text)
-            annotation_run.font.size = Pt(8)
-            annotation_run.font.color.rgb = RGBColor(128, 128, 128)
+            annotation_run.font.size = ANNOTATION_SIZE
+            annotation_run.font.color.rgb = ANNOTATION_COLOR
             annotation_run.italic = True
 
+    def _inline_annotation_template(self) -> str:
+        """Get the inline annotation format string for the current config."""
+        config = self.annotation_config
+        key = (config.show_source_id, config.show_action_type, config.show_confidence)
+        
+        if key != self._annotation_template_key:
+            parts = []
+            if config.show_source_id:
+                parts.append("[TS:{source}]")
+            if config.show_action_type:
+                parts.append("[{action}]")
+            if config.show_confidence:
+                parts.append("[Conf:{confidence:.2f}]")
+            self._annotation_template = " " + " ".join(parts) if parts else ""
+            self._annotation_template_key = key
+        
+        return self._annotation_template
+
     def _append_to_paragraph(
         self,
         para: Paragraph,
@@ -536,7 +610,7 @@ class ContractGenerator(IContractGenerator):
         doc: Document,
         mod: Modification,
         with_annotations: bool,
-    ) -> None:
+    ) -> Paragraph:
         """Insert new content when original location not found."""
         # Add a new paragraph at the end
         para = doc.add_paragraph()
@@ -545,6 +619,8 @@ class ContractGenerator(IContractGenerator):
         if with_annotations:
             self._add_modification_highlight(run, mod)
             self._add_inline_annotation(para, mod)
+        
+        return para
 
     def _record_conflict(
         self,
@@ -617,8 +693,10 @@ class ContractGenerator(IContractGenerator):
         # Ensure output directory exists
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
         
-        # Save the document
-        doc.save(output_path)
+        # Serialize in memory, then write the file in one call
+        buffer = io.BytesIO()
+        doc.save(buffer)
+        Path(output_path).write_bytes(buffer.getvalue())
         
         return output_path
 
@@ -637,6 +715,18 @@ class ContractGenerator(IContractGenerator):
         Returns:
             Tuple of (revision_tracked_path, clean_version_path).
         """
+        if self._parallel_export:
+            # The two builds share no document state; lxml serialization and
+            # file writes release the GIL, so threads overlap most of the work.
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                revision_future = executor.submit(
+                    self.export_with_template, contract, template_path, True
+                )
+                clean_future = executor.submit(
+                    self.export_with_template, contract, template_path, False
+                )
+                return revision_future.result(), clean_future.result()
+        
         # Export revision-tracked version
         revision_path = self.export_with_template(
             contract, template_path, with_revisions=True
@@ -1,25 +1,56 @@
 """Document export functionality for generated contracts."""
 
 import copy
+import io
 import logging
 import os
-from datetime import datetime
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Iterator, List, NamedTuple, Optional, Set, Tuple, Union
 
 from docx import Document
 from docx.enum.text import WD_COLOR_INDEX
 from docx.oxml import OxmlElement
-from docx.oxml.ns import qn
-from docx.shared import Pt, RGBColor
+from docx.shared import RGBColor
+from docx.text.run import Run
 
 from ..interfaces.generator import GeneratedContract, Modification
 from ..models.enums import ActionType
-from .annotation_manager import AnnotationConfig, AnnotationManager, AnnotationStyle
+from .annotation_manager import (
+    ACTION_LABEL,
+    ANNOTATION_COLOR,
+    ANNOTATION_SIZE,
+    AnnotationConfig,
+    AnnotationManager,
+)
+from .paragraph_index import ParagraphIndex
 
 
 logger = logging.getLogger(__name__)
 
+# Shared formatting values; RGBColor values are immutable
+_DELETED_COLOR = RGBColor(255, 0, 0)
+_INSERT_HIGHLIGHT = WD_COLOR_INDEX.BRIGHT_GREEN
+
+
+class _RunFormatting(NamedTuple):
+    """Character formatting of a paragraph's first run."""
+    bold: Optional[bool]
+    italic: Optional[bool]
+    underline: Optional[Any]
+    font_name: Optional[str]
+    font_size: Optional[Any]
+
+
+_NO_RUN_FORMATTING = _RunFormatting(None, None, None, None, None)
+
+
+def _truncate(text: str, limit: int = 100) -> str:
+    """Shorten text for the diff report, marking cut text with an ellipsis."""
+    return text if len(text) <= limit else text[:limit] + "..."
+
 
 class DocumentExporter:
     """
@@ -33,6 +64,7 @@ class DocumentExporter:
         self,
         output_dir: str = "data/generated",
         annotation_config: Optional[AnnotationConfig] = None,
+        parallel_export: bool = True,
     ):
         """
         Initialize the document exporter.
@@ -40,39 +72,67 @@ class DocumentExporter:
         Args:
             output_dir: Directory for exported files.
             annotation_config: Configuration for annotations.
+            parallel_export: Whether export_both_versions builds the two
+                documents concurrently.
         """
         self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        # Directories already created by this exporter
+        self._ensured_dirs: Set[Path] = set()
+        self._ensure_dir(self.output_dir)
         self.annotation_config = annotation_config or AnnotationConfig()
-        self.annotation_manager = AnnotationManager(self.annotation_config)
+        self._parallel_export = parallel_export
+
+    @cached_property
+    def annotation_manager(self) -> AnnotationManager:
+        """Annotation manager, created on first use."""
+        return AnnotationManager(self.annotation_config)
+
+    def _ensure_dir(self, path: Path) -> None:
+        """Create a directory once per exporter instance."""
+        if path in self._ensured_dirs:
+            return
+        path.mkdir(parents=True, exist_ok=True)
+        self._ensured_dirs.add(path)
 
     def export_revision_tracked(
         self,
         contract: GeneratedContract,
-        template_path: str,
+        template_path: Union[str, Any],
     ) -> str:
         """
         Export contract with revision tracking marks.
         
         Args:
             contract: The generated contract.
-            template_path: Path to the template document.
+            template_path: Path to the template document, or an already
+                loaded Document that will be modified in place.
             
         Returns:
             Path to the exported file.
         """
-        doc = Document(template_path)
-        
+        return self._export_revision_tracked(
+            contract, self._load_template(template_path), contract.modifications
+        )
+
+    def _export_revision_tracked(
+        self,
+        contract: GeneratedContract,
+        doc: Document,
+        modifications: List[Modification],
+        presorted: bool = False,
+        index: Optional[ParagraphIndex] = None,
+    ) -> str:
+        """Apply modifications with tracking to a loaded template and save it."""
         # Apply modifications with tracking
-        self._apply_modifications_with_tracking(doc, contract.modifications)
+        self._apply_modifications_with_tracking(doc, modifications, presorted, index)
         
         # Enable track changes mode
         self._enable_track_changes(doc)
         
         # Save the document
         output_path = contract.revision_tracked_path
-        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-        doc.save(output_path)
+        self._ensure_dir(Path(output_path).parent)
+        self._save_document(doc, output_path)
         
         logger.info(f"Exported revision-tracked document to: {output_path}")
         return output_path
@@ -80,31 +140,60 @@ class DocumentExporter:
     def export_clean_version(
         self,
         contract: GeneratedContract,
-        template_path: str,
+        template_path: Union[str, Any],
     ) -> str:
         """
         Export clean final version without revision marks.
         
         Args:
             contract: The generated contract.
-            template_path: Path to the template document.
+            template_path: Path to the template document, or an already
+                loaded Document that will be modified in place.
             
         Returns:
             Path to the exported file.
         """
-        doc = Document(template_path)
-        
+        return self._export_clean_version(
+            contract, self._load_template(template_path), contract.modifications
+        )
+
+    def _export_clean_version(
+        self,
+        contract: GeneratedContract,
+        doc: Document,
+        modifications: List[Modification],
+        presorted: bool = False,
+        index: Optional[ParagraphIndex] = None,
+    ) -> str:
+        """Apply modifications without tracking to a loaded template and save it."""
         # Apply modifications without annotations
-        self._apply_modifications_clean(doc, contract.modifications)
+        self._apply_modifications_clean(doc, modifications, presorted, index)
         
         # Save the document
         output_path = contract.clean_version_path
-        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-        doc.save(output_path)
+        self._ensure_dir(Path(output_path).parent)
+        self._save_document(doc, output_path)
         
         logger.info(f"Exported clean document to: {output_path}")
         return output_path
 
+    @staticmethod
+    def _save_document(doc: Document, output_path: str) -> None:
+        """
+        Save a document with a single large write.
+        
+        python-docx streams the zip package in many small writes, which is
+        slow on network filesystems; the package is built in memory first.
+        
+        Args:
+            doc: The document to save.
+            output_path: Destination file path.
+        """
+        buffer = io.BytesIO()
+        doc.save(buffer)
+        with open(output_path, "wb", buffering=1 << 20) as f:
+            f.write(buffer.getbuffer())
+
     def export_both_versions(
         self,
         contract: GeneratedContract,
@@ -120,14 +209,55 @@ class DocumentExporter:
         Returns:
             Tuple of (revision_tracked_path, clean_version_path).
         """
-        revision_path = self.export_revision_tracked(contract, template_path)
-        clean_path = self.export_clean_version(contract, template_path)
-        return revision_path, clean_path
+        # Both versions apply modifications in the same order; sort once
+        sorted_mods = self._sort_modifications(contract.modifications)
+        
+        # Read the template from disk once and load each copy from memory
+        template_bytes = Path(template_path).read_bytes()
+        revision_doc = Document(io.BytesIO(template_bytes))
+        clean_doc = Document(io.BytesIO(template_bytes))
+        
+        # Both copies start with identical text; locate snippets only once
+        clean_index = ParagraphIndex(
+            clean_doc.paragraphs, (m.original_text for m in sorted_mods)
+        )
+        revision_index = clean_index.rebind(revision_doc.paragraphs)
+        
+        def export_revision() -> str:
+            return self._export_revision_tracked(
+                contract, revision_doc, sorted_mods, presorted=True, index=revision_index
+            )
+        
+        def export_clean() -> str:
+            return self._export_clean_version(
+                contract, clean_doc, sorted_mods, presorted=True, index=clean_index
+            )
+        
+        if self._parallel_export:
+            # Each build works on its own Document and output file
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                revision_future = executor.submit(export_revision)
+                clean_future = executor.submit(export_clean)
+                return revision_future.result(), clean_future.result()
+        
+        return export_revision(), export_clean()
+
+    def _load_template(self, template: Union[str, Any]) -> Any:
+        """Open a template path, passing already loaded documents through."""
+        if isinstance(template, (str, os.PathLike)):
+            return Document(template)
+        return template
+
+    def _sort_modifications(self, modifications: List[Modification]) -> List[Modification]:
+        """Order modifications by location, last first, to preserve positions."""
+        return sorted(modifications, key=lambda m: m.location_start, reverse=True)
 
     def _apply_modifications_with_tracking(
         self,
         doc: Document,
         modifications: List[Modification],
+        presorted: bool = False,
+        index: Optional[ParagraphIndex] = None,
     ) -> None:
         """
         Apply modifications with revision tracking.
@@ -135,79 +265,111 @@ class DocumentExporter:
         Args:
             doc: The document to modify.
             modifications: List of modifications to apply.
+            presorted: Whether modifications are already in application order.
+            index: Prebuilt index over the document's paragraphs, if any.
         """
-        # Sort modifications by location (reverse order)
-        sorted_mods = sorted(
-            modifications,
-            key=lambda m: m.location_start,
-            reverse=True,
+        sorted_mods = (
+            modifications if presorted else self._sort_modifications(modifications)
         )
         
+        if index is None:
+            index = ParagraphIndex(doc.paragraphs, (m.original_text for m in sorted_mods))
         for mod in sorted_mods:
-            self._apply_tracked_modification(doc, mod)
+            self._apply_tracked_modification(doc, mod, index)
 
     def _apply_tracked_modification(
         self,
         doc: Document,
         mod: Modification,
+        index: ParagraphIndex,
     ) -> None:
         """Apply a single modification with tracking."""
         # Find the target paragraph
-        target_para = self._find_target_paragraph(doc, mod)
+        position = self._find_target_paragraph(index, mod)
         
-        if target_para is None:
+        if position is None:
             if mod.action == ActionType.INSERT:
                 # Add new paragraph for insertions
-                self._add_new_paragraph_with_tracking(doc, mod)
+                index.append(self._add_new_paragraph_with_tracking(doc, mod))
             return
         
+        target_para = index.paragraphs[position]
         if mod.action == ActionType.OVERRIDE:
-            self._apply_override_with_tracking(target_para, mod)
+            self._apply_override_with_tracking(target_para, index.texts[position], mod)
         elif mod.action == ActionType.INSERT:
             self._apply_insert_with_tracking(target_para, mod)
+        index.refresh(position)
 
     def _find_target_paragraph(
         self,
-        doc: Document,
+        index: ParagraphIndex,
         mod: Modification,
-    ) -> Optional[any]:
-        """Find the paragraph containing the modification target."""
-        for para in doc.paragraphs:
-            if mod.original_text and mod.original_text in para.text:
-                return para
-        return None
+    ) -> Optional[int]:
+        """Find the index of the paragraph containing the modification target."""
+        return index.find(mod.original_text)
 
     def _apply_override_with_tracking(
         self,
         para: any,
+        text: str,
         mod: Modification,
     ) -> None:
         """Apply an override modification with tracking."""
+        # Common case: the original text occurs once, inside a single run.
+        # Split that run around it so the rest of the paragraph is untouched.
+        if text.count(mod.original_text) == 1:
+            for run in para.runs:
+                run_text = run.text
+                start = run_text.find(mod.original_text)
+                if start < 0:
+                    continue
+                end = start + len(mod.original_text)
+                
+                # Copies are inserted directly after the run, so add them
+                # in reverse: [before][deleted][inserted][after]
+                if end < len(run_text):
+                    self._insert_run_after(run, run_text[end:])
+                ins_run = self._insert_run_after(run, mod.new_text)
+                ins_run.font.highlight_color = _INSERT_HIGHLIGHT
+                del_run = self._insert_run_after(run, mod.original_text)
+                del_run.font.strike = True
+                del_run.font.color.rgb = _DELETED_COLOR
+                run.text = run_text[:start]
+                
+                self._add_tracking_annotation(para, mod)
+                return
+        
         # Store original formatting
         original_formatting = self._capture_paragraph_formatting(para)
         
-        # Replace text
-        new_text = para.text.replace(mod.original_text, mod.new_text)
-        
-        # Clear and rebuild paragraph
+        # Rebuild the paragraph from the indexed text, marking every
+        # occurrence as [deleted][inserted] and keeping the text around it
+        pieces = text.split(mod.original_text) if mod.original_text else [text, ""]
         para.clear()
-        
-        # Add deleted text (strikethrough)
-        if mod.original_text:
-            del_run = para.add_run(mod.original_text)
-            del_run.font.strike = True
-            del_run.font.color.rgb = RGBColor(255, 0, 0)
-        
-        # Add inserted text (highlighted)
-        ins_run = para.add_run(mod.new_text)
-        ins_run.font.highlight_color = WD_COLOR_INDEX.BRIGHT_GREEN
-        
-        # Apply original formatting to new run
-        self._apply_formatting_to_run(ins_run, original_formatting)
+        for i, piece in enumerate(pieces):
+            if i:
+                if mod.original_text:
+                    del_run = para.add_run(mod.original_text)
+                    del_run.font.strike = True
+                    del_run.font.color.rgb = _DELETED_COLOR
+                ins_run = para.add_run(mod.new_text)
+                ins_run.font.highlight_color = _INSERT_HIGHLIGHT
+                self._apply_formatting_to_run(ins_run, original_formatting)
+            if piece:
+                run = para.add_run(piece)
+                self._apply_formatting_to_run(run, original_formatting)
         
         # Add annotation
         self._add_tracking_annotation(para, mod)
 
+    def _insert_run_after(self, run: Run, text: str) -> Run:
+        """Insert a copy of a run (keeping its formatting) with new text after it."""
+        new_r = copy.deepcopy(run._r)
+        run._r.addnext(new_r)
+        new_run = Run(new_r, run._parent)
+        new_run.text = text
+        return new_run
+
     def _apply_insert_with_tracking(
         self,
         para: any,
@@ -216,7 +378,7 @@ class DocumentExporter:
         """Apply an insert modification with tracking."""
         # Add the new text with highlight
         ins_run = para.add_run(f" {mod.new_text}")
-        ins_run.font.highlight_color = WD_COLOR_INDEX.BRIGHT_GREEN
+        ins_run.font.highlight_color = _INSERT_HIGHLIGHT
         
         # Add annotation
         self._add_tracking_annotation(para, mod)
@@ -225,16 +387,17 @@ class DocumentExporter:
         self,
         doc: Document,
         mod: Modification,
-    ) -> None:
+    ) -> any:
         """Add a new paragraph for inserted content."""
         para = doc.add_paragraph()
         
         # Add the new text with highlight
         ins_run = para.add_run(mod.new_text)
-        ins_run.font.highlight_color = WD_COLOR_INDEX.BRIGHT_GREEN
+        ins_run.font.highlight_color = _INSERT_HIGHLIGHT
         
         # Add annotation
         self._add_tracking_annotation(para, mod)
+        return para
 
     def _add_tracking_annotation(
         self,
@@ -242,17 +405,22 @@ class DocumentExporter:
         mod: Modification,
     ) -> None:
         """Add tracking annotation to a paragraph."""
-        annotation_text = f" 【TS:{mod.source_ts_paragraph_id} | {mod.action.value.upper()} | 置信度:{mod.confidence:.0%}】"
+        annotation_text = (
+            f" 【TS:{mod.source_ts_paragraph_id} | {ACTION_LABEL[mod.action]}"
+            f" | 置信度:{mod.confidence:.0%}】"
+        )
         
         ann_run = para.add_run(annotation_text)
-        ann_run.font.size = Pt(8)
-        ann_run.font.color.rgb = RGBColor(128, 128, 128)
+        ann_run.font.size = ANNOTATION_SIZE
+        ann_run.font.color.rgb = ANNOTATION_COLOR
         ann_run.italic = True
 
     def _apply_modifications_clean(
         self,
         doc: Document,
         modifications: List[Modification],
+        presorted: bool = False,
+        index: Optional[ParagraphIndex] = None,
     ) -> None:
         """
         Apply modifications without tracking marks.
@@ -260,37 +428,48 @@ class DocumentExporter:
         Args:
             doc: The document to modify.
             modifications: List of modifications to apply.
+            presorted: Whether modifications are already in application order.
+            index: Prebuilt index over the document's paragraphs, if any.
         """
-        # Sort modifications by location (reverse order)
-        sorted_mods = sorted(
-            modifications,
-            key=lambda m: m.location_start,
-            reverse=True,
+        sorted_mods = (
+            modifications if presorted else self._sort_modifications(modifications)
         )
         
+        if index is None:
+            index = ParagraphIndex(doc.paragraphs, (m.original_text for m in sorted_mods))
         for mod in sorted_mods:
-            self._apply_clean_modification(doc, mod)
+            self._apply_clean_modification(doc, mod, index)
 
     def _apply_clean_modification(
         self,
         doc: Document,
         mod: Modification,
+        index: ParagraphIndex,
     ) -> None:
         """Apply a single modification without tracking."""
-        target_para = self._find_target_paragraph(doc, mod)
+        position = self._find_target_paragraph(index, mod)
         
-        if target_para is None:
+        if position is None:
             if mod.action == ActionType.INSERT:
                 para = doc.add_paragraph()
                 para.add_run(mod.new_text)
+                index.append(para)
             return
         
+        target_para = index.paragraphs[position]
         if mod.action == ActionType.OVERRIDE:
+            text = index.texts[position]
+            
+            # Edit the run in place when it holds every occurrence
+            if self._replace_in_single_run(target_para, text, mod):
+                index.refresh(position)
+                return
+            
             # Store original formatting
             original_formatting = self._capture_paragraph_formatting(target_para)
             
-            # Replace text
-            new_text = target_para.text.replace(mod.original_text, mod.new_text)
+            # Replace text, reusing the indexed paragraph text
+            new_text = text.replace(mod.original_text, mod.new_text)
             
             # Clear and rebuild
             target_para.clear()
@@ -299,36 +478,49 @@ class DocumentExporter:
             
         elif mod.action == ActionType.INSERT:
             target_para.add_run(f" {mod.new_text}")
+        index.refresh(position)
+
+    def _replace_in_single_run(self, para: any, text: str, mod: Modification) -> bool:
+        """
+        Replace the original text inside the one run that contains all of it.
+        
+        Returns:
+            True if the replacement was made, False if the original text
+            spans several runs and the paragraph must be rebuilt.
+        """
+        occurrences = text.count(mod.original_text)
+        for run in para.runs:
+            run_text = run.text
+            if run_text.count(mod.original_text) == occurrences:
+                run.text = run_text.replace(mod.original_text, mod.new_text)
+                return True
+        return False
 
-    def _capture_paragraph_formatting(self, para: any) -> Dict:
+    def _capture_paragraph_formatting(self, para: any) -> _RunFormatting:
         """Capture formatting from a paragraph."""
-        formatting = {
-            "alignment": para.alignment,
-            "style": para.style.name if para.style else None,
-        }
-        
-        if para.runs:
-            first_run = para.runs[0]
-            formatting["bold"] = first_run.bold
-            formatting["italic"] = first_run.italic
-            formatting["underline"] = first_run.underline
-            formatting["font_name"] = first_run.font.name
-            formatting["font_size"] = first_run.font.size
-        
-        return formatting
-
-    def _apply_formatting_to_run(self, run: any, formatting: Dict) -> None:
+        runs = para.runs
+        if not runs:
+            return _NO_RUN_FORMATTING
+        
+        first_run = runs[0]
+        font = first_run.font
+        return _RunFormatting(
+            first_run.bold, first_run.italic, first_run.underline, font.name, font.size
+        )
+
+    def _apply_formatting_to_run(self, run: any, formatting: _RunFormatting) -> None:
         """Apply formatting to a run."""
-        if formatting.get("bold") is not None:
-            run.bold = formatting["bold"]
-        if formatting.get("italic") is not None:
-            run.italic = formatting["italic"]
-        if formatting.get("underline") is not None:
-            run.underline = formatting["underline"]
-        if formatting.get("font_name"):
-            run.font.name = formatting["font_name"]
-        if formatting.get("font_size"):
-            run.font.size = formatting["font_size"]
+        bold, italic, underline, font_name, font_size = formatting
+        if bold is not None:
+            run.bold = bold
+        if italic is not None:
+            run.italic = italic
+        if underline is not None:
+            run.underline = underline
+        if font_name:
+            run.font.name = font_name
+        if font_size:
+            run.font.size = font_size
 
     def _enable_track_changes(self, doc: Document) -> None:
         """Enable track changes mode in the document."""
@@ -356,7 +548,11 @@ class DocumentExporter:
         Returns:
             Diff report as a string.
         """
-        lines = [
+        return "\n".join(self._iter_diff_report_lines(contract))
+
+    def _iter_diff_report_lines(self, contract: GeneratedContract) -> Iterator[str]:
+        """Yield the diff report line by line, without line endings."""
+        yield from (
             "=" * 60,
             "CONTRACT MODIFICATION REPORT",
             f"Generated: {contract.generation_timestamp}",
@@ -364,29 +560,29 @@ class DocumentExporter:
             f"TS Document ID: {contract.ts_document_id}",
             "=" * 60,
             "",
-        ]
+        )
         
+        action_counts: Counter = Counter()
         for i, mod in enumerate(contract.modifications, 1):
-            lines.extend([
+            action_counts[mod.action] += 1
+            yield from (
                 f"Modification #{i}",
                 f"  ID: {mod.id}",
                 f"  Action: {mod.action.value}",
                 f"  Source TS Paragraph: {mod.source_ts_paragraph_id}",
                 f"  Confidence: {mod.confidence:.2%}",
-                f"  Original: {mod.original_text[:100]}..." if len(mod.original_text) > 100 else f"  Original: {mod.original_text}",
-                f"  New: {mod.new_text[:100]}..." if len(mod.new_text) > 100 else f"  New: {mod.new_text}",
+                f"  Original: {_truncate(mod.original_text)}",
+                f"  New: {_truncate(mod.new_text)}",
                 "",
-            ])
+            )
         
-        lines.extend([
+        yield from (
             "=" * 60,
             f"Total Modifications: {len(contract.modifications)}",
-            f"Insertions: {sum(1 for m in contract.modifications if m.action == ActionType.INSERT)}",
-            f"Overrides: {sum(1 for m in contract.modifications if m.action == ActionType.OVERRIDE)}",
+            f"Insertions: {action_counts[ActionType.INSERT]}",
+            f"Overrides: {action_counts[ActionType.OVERRIDE]}",
             "=" * 60,
-        ])
-        
-        return "\n".join(lines)
+        )
 
     def export_diff_report(
         self,
@@ -408,11 +604,14 @@ class DocumentExporter:
                 self.output_dir / f"diff_report_{contract.id[:8]}.txt"
             )
         
-        report = self.generate_diff_report(contract)
-        
-        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(report)
+        self._ensure_dir(Path(output_path).parent)
+        with open(output_path, "wb", buffering=1 << 16) as f:
+            # Stream encoded lines straight to the file; the full report is
+            # never held, and no text-mode codec layer sits in between
+            f.writelines(
+                f"{line}\n".encode("utf-8")
+                for line in self._iter_diff_report_lines(contract)
+            )
         
         logger.info(f"Exported diff report to: {output_path}")
         return output_path
@@ -0,0 +1,131 @@
+"""Paragraph lookup index for applying modifications to Word documents."""
+
+import bisect
+from typing import Dict, Iterable, List, Optional
+
+from docx.text.paragraph import Paragraph
+
+try:  # Optional accelerator for multi-pattern search
+    import ahocorasick
+except ImportError:  # pragma: no cover - depends on environment
+    ahocorasick = None
+
+
+class ParagraphIndex:
+    """
+    Locates the first paragraph of a document containing a text snippet.
+
+    Paragraph texts are read once and every snippet is located up front
+    (in a single Aho-Corasick sweep when ``pyahocorasick`` is installed),
+    so finding a target paragraph no longer re-walks the document's XML
+    for each modification. Paragraphs edited or appended afterwards are
+    tracked as dirty and re-checked against their current text, keeping
+    lookups equivalent to a fresh linear scan of ``doc.paragraphs``.
+    """
+
+    def __init__(self, paragraphs: Iterable[Paragraph], snippets: Iterable[str]):
+        """
+        Build the index.
+
+        Args:
+            paragraphs: The document's paragraphs, in document order.
+            snippets: Texts that will be looked up with find().
+        """
+        self.paragraphs: List[Paragraph] = list(paragraphs)
+        self.texts: List[str] = [para.text for para in self.paragraphs]
+        self._hits = self._index_snippets({s for s in snippets if s})
+        self._dirty: List[int] = []  # sorted indices changed since indexing
+
+    def _index_snippets(self, snippets: set) -> Dict[str, List[int]]:
+        """Map each snippet to the ascending indices of paragraphs containing it."""
+        if ahocorasick is None or len(snippets) < 2:
+            return {
+                snippet: [i for i, text in enumerate(self.texts) if snippet in text]
+                for snippet in snippets
+            }
+
+        automaton = ahocorasick.Automaton()
+        for snippet in snippets:
+            automaton.add_word(snippet, snippet)
+        automaton.make_automaton()
+
+        hits: Dict[str, List[int]] = {snippet: [] for snippet in snippets}
+        for i, text in enumerate(self.texts):
+            for snippet in {found for _, found in automaton.iter(text)}:
+                hits[snippet].append(i)
+        return hits
+
+    def rebind(self, paragraphs: Iterable[Paragraph]) -> "ParagraphIndex":
+        """
+        Create an index over another, identical copy of the document.
+
+        The snippet hits are shared rather than recomputed, so the copy must
+        have the same paragraph texts this index was built from, and this
+        index must not have been modified yet.
+
+        Args:
+            paragraphs: The copy's paragraphs, in document order.
+
+        Returns:
+            A new index tracking edits to the copy independently.
+        """
+        paragraphs = list(paragraphs)
+        if len(paragraphs) != len(self.paragraphs) or self._dirty:
+            raise ValueError("Can only rebind an unmodified index to an identical document")
+
+        index = ParagraphIndex.__new__(ParagraphIndex)
+        index.paragraphs = paragraphs
+        index.texts = list(self.texts)
+        index._hits = self._hits  # never mutated after construction
+        index._dirty = []
+        return index
+
+    def find(self, snippet: str) -> Optional[int]:
+        """
+        Find the first paragraph currently containing a snippet.
+
+        Args:
+            snippet: Text to search for.
+
+        Returns:
+            Paragraph index, or None if no paragraph contains the snippet.
+        """
+        if not snippet:
+            return None
+
+        hits = self._hits.get(snippet)
+        if hits is None:
+            # Not indexed up front; scan the current paragraph texts
+            return next((i for i, text in enumerate(self.texts) if snippet in text), None)
+
+        dirty = self._dirty
+        first = None
+        for i in hits:
+            pos = bisect.bisect_left(dirty, i)
+            if pos == len(dirty) or dirty[pos] != i:
+                first = i
+                break
+
+        # Edited paragraphs may have gained or lost the snippet
+        for i in dirty:
+            if first is not None and i > first:
+                break
+            if snippet in self.texts[i]:
+                return i
+        return first
+
+    def refresh(self, index: int) -> None:
+        """Re-read a paragraph's text after it has been modified."""
+        self.texts[index] = self.paragraphs[index].text
+        self._mark_dirty(index)
+
+    def append(self, para: Paragraph) -> None:
+        """Track a paragraph appended to the end of the document."""
+        self.paragraphs.append(para)
+        self.texts.append(para.text)
+        self._mark_dirty(len(self.paragraphs) - 1)
+
+    def _mark_dirty(self, index: int) -> None:
+        pos = bisect.bisect_left(self._dirty, index)
+        if pos == len(self._dirty) or self._dirty[pos] != index:
+            self._dirty.insert(pos, index)
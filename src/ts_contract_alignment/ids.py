@@ -0,0 +1,33 @@
+"""Identifier generation for documents, sections, segments and modifications."""
+
+import os
+import uuid
+from typing import List
+
+# UUIDs generated per os.urandom call
+_BATCH_SIZE = 256
+
+_pool: List[str] = []
+
+# A forked worker must not hand out the parent's remaining identifiers
+if hasattr(os, "register_at_fork"):  # Not available on Windows
+    os.register_at_fork(after_in_child=_pool.clear)
+
+
+def new_id() -> str:
+    """
+    Return a random UUID4 string.
+    
+    Parsers create one identifier per section and segment and the
+    generator one per modification, so randomness is drawn from the OS
+    in batches rather than with one urandom call per identifier.
+    """
+    while True:
+        try:
+            return _pool.pop()
+        except IndexError:
+            data = os.urandom(16 * _BATCH_SIZE)
+            _pool.extend(
+                str(uuid.UUID(bytes=data[i:i + 16], version=4))
+                for i in range(0, len(data), 16)
+            )
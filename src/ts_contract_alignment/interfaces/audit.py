@@ -90,6 +90,10 @@ class IAuditLogger(ABC):
         """
         Query audit events with optional filters.
         
+        Implementations should answer the document and event type filters
+        from an index keyed on those fields rather than scanning every
+        recorded event.
+        
         Args:
             document_id: Filter by document ID.
             event_type: Filter by event type.
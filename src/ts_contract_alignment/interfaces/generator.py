@@ -10,7 +10,7 @@ from ..models.enums import ActionType
 from ..models.extraction import TSExtractionResult
 
 
-@dataclass
+@dataclass(slots=True)
 class Modification:
     """
     Document modification record.
@@ -43,7 +43,7 @@ class Modification:
             self.status = "pending"
 
 
-@dataclass
+@dataclass(slots=True)
 class GeneratedContract:
     """
     Generated contract document.
@@ -41,6 +41,9 @@ class ReviewSession:
     
     Manages the review process for all modifications in a contract,
     tracking progress and user decisions.
+    
+    ``completed_count`` and ``total_count`` are derived from ``items``
+    when the session is constructed; callers need not compute them.
     """
     id: str
     contract_id: str
@@ -50,8 +53,6 @@ class ReviewSession:
     session_timestamp: str = ""
 
     def __post_init__(self):
-        if self.items is None:
-            self.items = []
         self.total_count = len(self.items)
         self.completed_count = sum(1 for item in self.items if item.action != ReviewAction.PENDING)
 
@@ -4,13 +4,14 @@ from .enums import (
     ActionType,
     ClauseCategory,
     DocumentType,
+    FillableType,
     HeadingLevel,
     MatchMethod,
     TermCategory,
 )
 from .document import TextSegment, DocumentSection, ParsedDocument
 from .extraction import ExtractedTerm, TSExtractionResult
-from .template import FillableSegment, FillableType, AnalyzedClause, TemplateAnalysisResult
+from .template import FillableSegment, AnalyzedClause, TemplateAnalysisResult
 from .alignment import AlignmentMatch, AlignmentResult
 
 __all__ = [
@@ -1,12 +1,14 @@
 """Alignment data models for the TS Contract Alignment System."""
 
+from __future__ import annotations
+
 from dataclasses import dataclass, field
 from typing import List, Optional
 
 from .enums import ActionType, MatchMethod
 
 
-@dataclass
+@dataclass(slots=True)
 class AlignmentMatch:
     """
     Alignment match between a TS term and a contract clause.
@@ -38,11 +40,3 @@ class AlignmentResult:
     unmatched_terms: List[str] = field(default_factory=list)
     unmatched_clauses: List[str] = field(default_factory=list)
     alignment_timestamp: str = ""
-
-    def __post_init__(self):
-        if self.matches is None:
-            self.matches = []
-        if self.unmatched_terms is None:
-            self.unmatched_terms = []
-        if self.unmatched_clauses is None:
-            self.unmatched_clauses = []
@@ -1,12 +1,14 @@
 """Document-related data models for the TS Contract Alignment System."""
 
+from __future__ import annotations
+
 from dataclasses import dataclass, field
-from typing import Any, List, Optional
+from typing import Any, Iterator, List, Optional
 
 from .enums import DocumentType, HeadingLevel
 
 
-@dataclass
+@dataclass(slots=True)
 class TextSegment:
     """
     Text segment with position and formatting information.
@@ -21,12 +23,8 @@ class TextSegment:
     language: str  # "zh", "en", "mixed"
     formatting: dict = field(default_factory=dict)  # bold, italic, font_size, etc.
 
-    def __post_init__(self):
-        if self.formatting is None:
-            self.formatting = {}
-
 
-@dataclass
+@dataclass(slots=True)
 class DocumentSection:
     """
     Document section structure with hierarchy support.
@@ -39,15 +37,9 @@ class DocumentSection:
     number: Optional[str]  # "1.1", "第一条" etc.
     level: HeadingLevel
     segments: List[TextSegment] = field(default_factory=list)
-    children: List["DocumentSection"] = field(default_factory=list)
+    children: List[DocumentSection] = field(default_factory=list)
     parent_id: Optional[str] = None
 
-    def __post_init__(self):
-        if self.segments is None:
-            self.segments = []
-        if self.children is None:
-            self.children = []
-
 
 @dataclass
 class ParsedDocument:
@@ -64,8 +56,18 @@ class ParsedDocument:
     metadata: dict = field(default_factory=dict)
     raw_text: str = ""
 
-    def __post_init__(self):
-        if self.sections is None:
-            self.sections = []
-        if self.metadata is None:
-            self.metadata = {}
+    def iter_sections(self) -> Iterator[DocumentSection]:
+        """
+        Iterate over all sections, including nested ones, in document order.
+        
+        The hierarchy is walked with an explicit stack, so deeply nested
+        documents neither recurse nor hit the interpreter's recursion limit.
+        
+        Yields:
+            Each section before its children (pre-order).
+        """
+        stack = list(reversed(self.sections))
+        while stack:
+            section = stack.pop()
+            yield section
+            stack.extend(reversed(section.children))
@@ -47,6 +47,16 @@ class ClauseCategory(Enum):
     MISCELLANEOUS = "miscellaneous"
 
 
+class FillableType(Enum):
+    """Types of fillable segments in contract templates."""
+    TEXT = "text"
+    NUMBER = "number"
+    DATE = "date"
+    PERCENTAGE = "percentage"
+    CURRENCY = "currency"
+    LIST = "list"
+
+
 class ActionType(Enum):
     """Types of actions for alignment operations."""
     INSERT = "insert"
@@ -1,12 +1,14 @@
 """TS extraction data models for the TS Contract Alignment System."""
 
+from __future__ import annotations
+
 from dataclasses import dataclass, field
 from typing import Any, List
 
 from .enums import TermCategory
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedTerm:
     """
     Term extracted from a Term Sheet document.
@@ -24,10 +26,6 @@ class ExtractedTerm:
     confidence: float
     metadata: dict = field(default_factory=dict)
 
-    def __post_init__(self):
-        if self.metadata is None:
-            self.metadata = {}
-
 
 @dataclass
 class TSExtractionResult:
@@ -41,9 +39,3 @@ class TSExtractionResult:
     terms: List[ExtractedTerm] = field(default_factory=list)
     unrecognized_sections: List[str] = field(default_factory=list)
     extraction_timestamp: str = ""
-
-    def __post_init__(self):
-        if self.terms is None:
-            self.terms = []
-        if self.unrecognized_sections is None:
-            self.unrecognized_sections = []
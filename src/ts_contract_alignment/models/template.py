@@ -1,21 +1,15 @@
 """Template analysis data models for the TS Contract Alignment System."""
 
-from dataclasses import dataclass, field
-from enum import Enum
-from typing import List, Optional
+from __future__ import annotations
 
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
 
-class FillableType(Enum):
-    """Types of fillable segments in contract templates."""
-    TEXT = "text"
-    NUMBER = "number"
-    DATE = "date"
-    PERCENTAGE = "percentage"
-    CURRENCY = "currency"
-    LIST = "list"
+from .enums import ClauseCategory, FillableType
 
 
-@dataclass
+@dataclass(slots=True)
 class FillableSegment:
     """
     Fillable segment in a contract template.
@@ -32,7 +26,7 @@ class FillableSegment:
     current_value: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalyzedClause:
     """
     Analyzed contract clause.
@@ -43,18 +37,12 @@ class AnalyzedClause:
     id: str
     section_id: str
     title: str
-    category: "ClauseCategory"  # Forward reference to avoid circular import
+    category: ClauseCategory
     full_text: str
     fillable_segments: List[FillableSegment] = field(default_factory=list)
     keywords: List[str] = field(default_factory=list)
     semantic_embedding: Optional[List[float]] = None
 
-    def __post_init__(self):
-        if self.fillable_segments is None:
-            self.fillable_segments = []
-        if self.keywords is None:
-            self.keywords = []
-
 
 @dataclass
 class TemplateAnalysisResult:
@@ -68,13 +56,26 @@ class TemplateAnalysisResult:
     clauses: List[AnalyzedClause] = field(default_factory=list)
     structure_map: dict = field(default_factory=dict)  # Preserves original structure mapping
     analysis_timestamp: str = ""
+    _keyword_index: Optional[Dict[str, List[int]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
-    def __post_init__(self):
-        if self.clauses is None:
-            self.clauses = []
-        if self.structure_map is None:
-            self.structure_map = {}
-
-
-# Import ClauseCategory here to resolve forward reference
-from .enums import ClauseCategory
+    @property
+    def keyword_index(self) -> Dict[str, List[int]]:
+        """
+        Map each lower-cased clause keyword to the indices of its clauses.
+        
+        Built on first access and cached; the result is treated as
+        immutable once analysis has finished, so later edits to
+        ``clauses`` are not reflected.
+        
+        Returns:
+            Dictionary from keyword to indices into ``clauses``.
+        """
+        if self._keyword_index is None:
+            index: Dict[str, List[int]] = {}
+            for i, clause in enumerate(self.clauses):
+                for keyword in clause.keywords:
+                    index.setdefault(sys.intern(keyword.lower()), []).append(i)
+            self._keyword_index = index
+        return self._keyword_index
@@ -26,8 +26,9 @@ class ParseError(Exception):
     def __post_init__(self):
         if self.details is None:
             self.details = {}
-        # Initialize Exception with the message
-        super().__init__(str(self))
+        # Initialize Exception with the bare message; the full description
+        # is only formatted by __str__ when the error is actually rendered
+        super().__init__(self.message)
 
     def __str__(self) -> str:
         parts = [self.message]
@@ -129,10 +130,14 @@ class ErrorHandler:
         self.file_path = file_path
         self.errors: list[ParseError] = []
         self.warnings: list[str] = []
+        # Number of DocumentCorruptedErrors among self.errors
+        self._critical_count = 0
 
     def add_error(self, error: ParseError) -> None:
         """Add an error to the collection."""
         self.errors.append(error)
+        if isinstance(error, DocumentCorruptedError):
+            self._critical_count += 1
 
     def add_warning(self, message: str, location: Optional[str] = None) -> None:
         """Add a warning message."""
@@ -147,7 +152,7 @@ class ErrorHandler:
 
     def has_critical_errors(self) -> bool:
         """Check if any critical (non-recoverable) errors were recorded."""
-        return any(isinstance(e, DocumentCorruptedError) for e in self.errors)
+        return self._critical_count > 0
 
     def get_summary(self) -> dict[str, Any]:
         """Get a summary of all errors and warnings."""
@@ -162,6 +167,8 @@ class ErrorHandler:
 
     def raise_if_critical(self) -> None:
         """Raise the first critical error if any exist."""
+        if not self._critical_count:
+            return
         for error in self.errors:
             if isinstance(error, DocumentCorruptedError):
                 raise error
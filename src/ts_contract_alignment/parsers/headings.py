@@ -0,0 +1,31 @@
+"""Heading pattern helpers shared by the document parsers."""
+
+import re
+from typing import Dict, List, Pattern, Tuple
+
+from ..models.enums import HeadingLevel
+
+
+def combine_heading_patterns(
+    patterns: List[Tuple[Pattern[str], HeadingLevel]],
+) -> Tuple[Pattern[str], Dict[int, Tuple[HeadingLevel, bool]]]:
+    """
+    Join ordered (pattern, level) pairs into one alternation.
+    
+    Alternatives are tried left to right, so the first pattern that
+    matches wins, just as when matching each pattern in turn. The
+    matching branch is ``match.lastindex``: each branch is wrapped in an
+    outer group, which closes after any groups nested inside it.
+    
+    Returns:
+        Tuple of the compiled alternation and a map from each branch's
+        outer group index to (level, has_number_group).
+    """
+    parts = []
+    branches = {}
+    group = 1
+    for pattern, level in patterns:
+        parts.append(f"({pattern.pattern})")
+        branches[group] = (level, pattern.groups > 0)
+        group += pattern.groups + 1
+    return re.compile("|".join(parts)), branches
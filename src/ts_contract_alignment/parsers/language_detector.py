@@ -1,10 +1,30 @@
 """Language detection utilities for document parsing."""
 
 import re
+import string
 from typing import Literal
 
 LanguageType = Literal["zh", "en", "mixed"]
 
+# Runs of everything except CJK Unified Ideographs (including Extension A)
+# or ASCII letters; deleting them leaves only the characters to count
+_NON_CHINESE_RE = re.compile(r'[^\u4e00-\u9fff\u3400-\u4dbf]+')
+_NON_ENGLISH_RE = re.compile(r'[^a-zA-Z]+')
+
+# Alternating runs of Chinese (group 1) and non-Chinese (group 2) text
+_SEGMENT_RE = re.compile(r'([\u4e00-\u9fff\u3400-\u4dbf]+)|([^\u4e00-\u9fff\u3400-\u4dbf]+)')
+
+# str.translate table deleting ASCII letters, used to count them in C
+_DELETE_ASCII_LETTERS = dict.fromkeys(map(ord, string.ascii_letters))
+
+
+def _count_chars(text: str) -> tuple[int, int]:
+    """Count (Chinese characters, English letters) in a text."""
+    if text.isascii():
+        # ASCII-only text has no CJK and translates on CPython's fast path
+        return 0, len(text) - len(text.translate(_DELETE_ASCII_LETTERS))
+    return len(_NON_CHINESE_RE.sub('', text)), len(_NON_ENGLISH_RE.sub('', text))
+
 
 def detect_language(text: str) -> LanguageType:
     """
@@ -19,14 +39,7 @@ def detect_language(text: str) -> LanguageType:
     if not text or not text.strip():
         return "en"
     
-    # Count Chinese characters (CJK Unified Ideographs range)
-    chinese_pattern = re.compile(r'[\u4e00-\u9fff\u3400-\u4dbf]')
-    chinese_chars = len(chinese_pattern.findall(text))
-    
-    # Count English letters
-    english_pattern = re.compile(r'[a-zA-Z]')
-    english_chars = len(english_pattern.findall(text))
-    
+    chinese_chars, english_chars = _count_chars(text)
     total_chars = chinese_chars + english_chars
     
     if total_chars == 0:
@@ -57,29 +70,11 @@ def segment_by_language(text: str) -> list[tuple[str, LanguageType]]:
     if not text:
         return []
     
-    segments = []
-    current_segment = ""
-    current_lang = None
-    
-    # Pattern to match Chinese character sequences or non-Chinese sequences
-    pattern = re.compile(r'([\u4e00-\u9fff\u3400-\u4dbf]+|[^\u4e00-\u9fff\u3400-\u4dbf]+)')
-    
-    for match in pattern.finditer(text):
-        chunk = match.group()
-        chunk_lang = detect_language(chunk)
-        
-        if current_lang is None:
-            current_lang = chunk_lang
-            current_segment = chunk
-        elif chunk_lang == current_lang or chunk_lang == "mixed":
-            current_segment += chunk
-        else:
-            if current_segment.strip():
-                segments.append((current_segment, current_lang))
-            current_segment = chunk
-            current_lang = chunk_lang
-    
-    if current_segment.strip():
-        segments.append((current_segment, current_lang))
-    
-    return segments
+    # Chunks alternate between CJK runs and everything else. A CJK run is
+    # all Chinese and anything else has no Chinese, so detect_language
+    # would classify them as "zh" and "en"; the matched group decides.
+    return [
+        (match.group(), "zh" if match.lastindex == 1 else "en")
+        for match in _SEGMENT_RE.finditer(text)
+        if not match.group().isspace()
+    ]
@@ -1,26 +1,118 @@
 """PDF document parser implementation."""
 
+import hashlib
+import logging
+import os
 import re
-import uuid
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Union
 
 import pdfplumber
-from PyPDF2 import PdfReader
-from PyPDF2.errors import PdfReadError
+import pypdfium2 as pdfium
+from pdfminer.pdftypes import resolve1
+from pdfplumber.utils.exceptions import PdfminerException
 
 from ..models.document import DocumentSection, ParsedDocument, TextSegment
 from ..models.enums import DocumentType, HeadingLevel
 from .exceptions import DocumentCorruptedError, ParseError, UnsupportedFormatError
+from .headings import combine_heading_patterns
+from ..ids import new_id
 from .language_detector import detect_language
+from .serialization import DocumentSerializer
+
+logger = logging.getLogger(__name__)
+
+# Below this many pages, worker start-up and re-opening the file cost more
+# than extracting the pages in-process
+_PARALLEL_PAGE_THRESHOLD = 8
+
+_PARA_SPLIT_RE = re.compile(r'\n\s*\n')
+_ENGLISH_WORD_RE = re.compile(r'[a-zA-Z]+')
+_CHINESE_RUN_RE = re.compile(r'[\u4e00-\u9fff]+')
+
+_HASH_CHUNK_SIZE = 1 << 20
+
+# Part of every cache key; bump it whenever a parser change alters the
+# document built from the same file, so stale entries are never loaded
+_CACHE_VERSION = 1
+
+
+def _page_may_have_text(page: pdfplumber.page.Page) -> bool:
+    """
+    Cheaply rule out pages that cannot contain text, such as scanned images.
+    
+    Text is only drawn between BT/ET operators, either in the page's own
+    content streams or inside form XObjects it paints. Scanning the raw
+    streams for "BT" avoids the font loading and layout analysis that
+    extract_text() performs. Any doubt counts as possible text.
+    """
+    try:
+        page_obj = page.page_obj
+        xobjects = resolve1((page_obj.resources or {}).get("XObject")) or {}
+        for xobject in xobjects.values():
+            subtype = resolve1(xobject).get("Subtype")
+            if getattr(subtype, "name", None) != "Image":
+                return True
+        return any(b"BT" in resolve1(stream).get_data() for stream in page_obj.contents)
+    except Exception:
+        return True
+
+
+def _extract_text(page: pdfplumber.page.Page) -> str:
+    """Extract a page's text, skipping pages that cannot contain any."""
+    if not _page_may_have_text(page):
+        return ""
+    return page.extract_text() or ""
+
+
+def _extract_texts_pdfium(file_path: str) -> List[str]:
+    """
+    Extract the text of every page with PDFium, in page order.
+    
+    PDFium's native text extraction skips pdfminer's layout analysis and
+    is much faster, at the cost of pdfplumber's layout-aware line joining.
+    """
+    document = pdfium.PdfDocument(file_path)
+    try:
+        texts = []
+        for page in document:
+            textpage = page.get_textpage()
+            texts.append(textpage.get_text_range().replace("\r\n", "\n"))
+            textpage.close()
+            page.close()
+        return texts
+    finally:
+        document.close()
+
+
+def _extract_page_range(file_path: str, start: int, stop: int) -> List[str]:
+    """
+    Extract the text of pages [start, stop) in a worker process.
+    
+    Only the requested pages are loaded, so each worker parses its own
+    slice of the document. Pages without text yield an empty string.
+    """
+    with pdfplumber.open(file_path, pages=range(start + 1, stop + 1)) as pdf:
+        return [_extract_text(page) for page in pdf.pages]
+
+
+# Every heading pattern starts with one of these or a decimal digit (\d)
+_HEADING_FIRST_CHARS = frozenset("第一二三四五六七八九十(（")
+
+
+def _may_start_heading(text: str) -> bool:
+    """Cheap first-character test that rejects most body lines before any regex."""
+    return bool(text) and (text[0] in _HEADING_FIRST_CHARS or text[0].isdecimal())
 
 
 class PDFDocumentParser:
     """
     Parser for PDF documents.
     
-    Uses PyPDF2 for basic extraction and pdfplumber for
-    layout analysis and advanced text extraction.
+    Uses pdfplumber for validation and layout-aware text extraction,
+    with PDFium (pypdfium2) available as a faster text backend.
     """
 
     # Chinese heading patterns
@@ -32,15 +124,54 @@ class PDFDocumentParser:
         (re.compile(r'^[（(][0-9]+[)）]'), HeadingLevel.PARAGRAPH),
     ]
 
-    # Numbered heading patterns
+    # Numbered heading patterns, most specific first: the chapter pattern
+    # also matches the start of "1.2" and "1.2.3"
     NUMBERED_HEADING_PATTERNS = [
-        (re.compile(r'^(\d+)\s*[.、]?\s*(.*)'), HeadingLevel.CHAPTER),
-        (re.compile(r'^(\d+\.\d+)\s*[.、]?\s*(.*)'), HeadingLevel.SECTION),
         (re.compile(r'^(\d+\.\d+\.\d+)\s*[.、]?\s*(.*)'), HeadingLevel.SUBSECTION),
+        (re.compile(r'^(\d+\.\d+)\s*[.、]?\s*(.*)'), HeadingLevel.SECTION),
+        (re.compile(r'^(\d+)\s*[.、]?\s*(.*)'), HeadingLevel.CHAPTER),
     ]
 
-    def __init__(self):
+    # All heading patterns as one regex; match.lastindex identifies the branch
+    _HEADING_RE, _HEADING_BRANCHES = combine_heading_patterns(
+        CHINESE_HEADING_PATTERNS + NUMBERED_HEADING_PATTERNS
+    )
+
+    # Engines available for page text extraction
+    TEXT_BACKENDS = ("pdfplumber", "pdfium")
+
+    def __init__(
+        self,
+        page_workers: Optional[int] = 1,
+        cache_dir: Optional[Union[str, Path]] = None,
+        text_backend: str = "pdfplumber"
+    ):
+        """
+        Initialize the PDF parser.
+        
+        Args:
+            page_workers: Maximum number of processes used to extract page
+                text from long documents with pdfplumber. Defaults to 1,
+                which always extracts in-process; None uses one process
+                per CPU.
+            cache_dir: Optional directory for parsed documents keyed by a
+                hash of the file contents. Unchanged files are then loaded
+                from the cache instead of being parsed again, with fresh ids.
+            text_backend: "pdfplumber" for layout-aware extraction, or
+                "pdfium" for PDFium's much faster native extraction.
+            
+        Raises:
+            ValueError: If text_backend is not one of TEXT_BACKENDS.
+        """
+        if text_backend not in self.TEXT_BACKENDS:
+            raise ValueError(
+                f"Unknown text backend {text_backend!r}; "
+                f"expected one of {self.TEXT_BACKENDS}"
+            )
+        self._text_backend = text_backend
         self._current_position = 0
+        self._page_workers = page_workers
+        self._cache_dir = Path(cache_dir) if cache_dir is not None else None
 
     def parse(self, file_path: str) -> ParsedDocument:
         """
@@ -69,13 +200,79 @@ class PDFDocumentParser:
                 location="file extension"
             )
         
+        if self._cache_dir is None:
+            return self._parse_pdf(file_path, path)
+        
+        # Backends lay text out differently, so each keeps its own entries
+        cache_path = self._cache_dir / (
+            f"{self._fingerprint(path)}-{self._text_backend}-v{_CACHE_VERSION}.json"
+        )
+        if cache_path.exists():
+            try:
+                doc = DocumentSerializer.deserialize_binary(cache_path.read_bytes())
+            except ValueError:
+                pass  # Unreadable entry; parse again and overwrite it
+            else:
+                doc.filename = path.name
+                self._assign_fresh_ids(doc)
+                return doc
+        
+        doc = self._parse_pdf(file_path, path)
+        # Write a uniquely named file then rename it, so concurrent writers
+        # never collide and readers never see a partial entry
+        tmp_path = None
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                dir=self._cache_dir, suffix=".tmp", delete=False
+            ) as tmp:
+                tmp_path = tmp.name
+                tmp.write(DocumentSerializer.serialize_binary(doc))
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Could not cache parsed PDF {file_path}: {e}")
+            if tmp_path is not None:
+                Path(tmp_path).unlink(missing_ok=True)
+        return doc
+
+    @staticmethod
+    def _assign_fresh_ids(doc: ParsedDocument) -> None:
+        """
+        Give a cached document new ids, as an uncached parse would.
+        
+        Document ids flow into stored contracts and alignments, so two
+        uploads of the same file must not share them.
+        """
+        doc.id = new_id()
+        new_ids = {}
+        for section in doc.iter_sections():  # Parents before children
+            new_ids[section.id] = section.id = new_id()
+            section.parent_id = new_ids.get(section.parent_id)
+            for segment in section.segments:
+                segment.id = new_id()
+
+    @staticmethod
+    def _fingerprint(path: Path) -> str:
+        """Hash the file contents, reading them in 1 MiB chunks."""
+        digest = hashlib.blake2b(digest_size=16)
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _parse_pdf(self, file_path: str, path: Path) -> ParsedDocument:
+        """Parse a validated PDF path without consulting the cache."""
         self._current_position = 0
         
-        # Try to open with PyPDF2 first for validation
+        # A single pdfplumber handle both validates the file and extracts it
         try:
-            pdf_reader = PdfReader(file_path)
-            page_count = len(pdf_reader.pages)
-        except PdfReadError as e:
+            pdf = pdfplumber.open(file_path)
+            try:
+                page_count = len(pdf.pages)
+            except BaseException:
+                pdf.close()
+                raise
+        except PdfminerException as e:
             raise DocumentCorruptedError(
                 message="PDF file is corrupted or encrypted",
                 file_path=file_path,
@@ -89,12 +286,11 @@ class PDFDocumentParser:
                 details={"original_error": str(e)}
             )
         
-        # Use pdfplumber for detailed extraction
         try:
-            with pdfplumber.open(file_path) as pdf:
-                raw_text = self._extract_raw_text(pdf)
-                sections = self._parse_sections(pdf)
-                metadata = self._extract_metadata(pdf, path, page_count)
+            with pdf:
+                page_texts = self._extract_page_texts(pdf, file_path)
+                sections, raw_text = self._parse_sections(page_texts)
+                metadata = self._extract_metadata(pdf, path, page_count, page_texts)
         except Exception as e:
             raise ParseError(
                 message=f"Failed to parse PDF content: {str(e)}",
@@ -103,7 +299,7 @@ class PDFDocumentParser:
             )
         
         return ParsedDocument(
-            id=str(uuid.uuid4()),
+            id=new_id(),
             filename=path.name,
             doc_type=DocumentType.PDF,
             sections=sections,
@@ -111,20 +307,42 @@ class PDFDocumentParser:
             raw_text=raw_text
         )
 
-    def _extract_raw_text(self, pdf: pdfplumber.PDF) -> str:
-        """Extract all text content from the PDF."""
-        text_parts = []
-        for page in pdf.pages:
-            page_text = page.extract_text()
-            if page_text:
-                text_parts.append(page_text)
-        return "\n\n".join(text_parts)
+    def _extract_page_texts(self, pdf: pdfplumber.PDF, file_path: str) -> List[str]:
+        """
+        Extract the text of every page exactly once, in page order.
+        
+        Page layout analysis dominates parse time, so long documents are
+        split into contiguous page ranges extracted in worker processes.
+        Pages without text yield an empty string.
+        """
+        if self._text_backend == "pdfium":
+            return _extract_texts_pdfium(file_path)
+        
+        page_count = len(pdf.pages)
+        workers = min(self._page_workers or os.cpu_count() or 1, page_count)
+        if page_count < _PARALLEL_PAGE_THRESHOLD or workers <= 1:
+            return [_extract_text(page) for page in pdf.pages]
+        
+        step = -(-page_count // workers)
+        starts = range(0, page_count, step)
+        stops = [min(start + step, page_count) for start in starts]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunks = executor.map(
+                _extract_page_range, [file_path] * len(starts), starts, stops
+            )
+            return [text for chunk in chunks for text in chunk]
 
-    def _extract_metadata(self, pdf: pdfplumber.PDF, path: Path, page_count: int) -> dict:
+    def _extract_metadata(
+        self,
+        pdf: pdfplumber.PDF,
+        path: Path,
+        page_count: int,
+        page_texts: List[str]
+    ) -> dict:
         """Extract document metadata."""
         metadata = {
             "page_count": page_count,
-            "word_count": self._count_words(pdf),
+            "word_count": self._count_words(page_texts),
             "file_size": path.stat().st_size if path.exists() else 0,
         }
         
@@ -141,26 +359,37 @@ class PDFDocumentParser:
         
         return metadata
 
-    def _count_words(self, pdf: pdfplumber.PDF) -> int:
+    def _count_words(self, page_texts: List[str]) -> int:
         """Count total words in the PDF."""
         total = 0
-        for page in pdf.pages:
-            text = page.extract_text() or ""
+        for text in page_texts:
             # English words
-            english_words = len(re.findall(r'[a-zA-Z]+', text))
+            english_words = len(_ENGLISH_WORD_RE.findall(text))
             # Chinese characters
-            chinese_chars = len(re.findall(r'[\u4e00-\u9fff]', text))
+            chinese_chars = sum(map(len, _CHINESE_RUN_RE.findall(text)))
             total += english_words + chinese_chars
         return total
 
-    def _parse_sections(self, pdf: pdfplumber.PDF) -> list[DocumentSection]:
-        """Parse PDF into hierarchical sections."""
+    def _parse_sections(
+        self, page_texts: List[str]
+    ) -> tuple[list[DocumentSection], str]:
+        """
+        Parse PDF into hierarchical sections.
+        
+        The raw text is built in the same pass, one paragraph per line, so
+        that every segment's start_pos/end_pos index into it exactly.
+        
+        Returns:
+            Tuple of (top-level sections, raw text).
+        """
         sections = []
+        raw_parts: list[str] = []
         current_section_stack: list[DocumentSection] = []
+        # Level values of current_section_stack, kept in lockstep with it
+        stack_levels: list[int] = []
         pending_segments: list[TextSegment] = []
         
-        for page_num, page in enumerate(pdf.pages, start=1):
-            page_text = page.extract_text()
+        for page_num, page_text in enumerate(page_texts, start=1):
             if not page_text:
                 continue
             
@@ -171,10 +400,12 @@ class PDFDocumentParser:
                 if not line.strip():
                     continue
                 
-                heading_info = self._detect_heading(line, page)
+                raw_parts.append(line)
+                heading_info = self._detect_heading(line)
                 
                 if heading_info:
                     level, number, title = heading_info
+                    self._current_position += len(line) + 1
                     
                     # Save pending segments
                     if pending_segments and current_section_stack:
@@ -198,8 +429,10 @@ class PDFDocumentParser:
                     )
                     
                     # Find appropriate parent
-                    while current_section_stack and current_section_stack[-1].level.value >= level.value:
+                    level_value = level.value
+                    while stack_levels and stack_levels[-1] >= level_value:
                         current_section_stack.pop()
+                        stack_levels.pop()
                     
                     if current_section_stack:
                         new_section.parent_id = current_section_stack[-1].id
@@ -208,6 +441,7 @@ class PDFDocumentParser:
                         sections.append(new_section)
                     
                     current_section_stack.append(new_section)
+                    stack_levels.append(level_value)
                 else:
                     # Regular text - create segment
                     segment = self._create_text_segment(line, page_num)
@@ -226,12 +460,12 @@ class PDFDocumentParser:
                 )
                 sections.append(root_section)
         
-        return sections
+        return sections, "\n".join(raw_parts)
 
     def _split_into_paragraphs(self, text: str) -> list[str]:
         """Split text into paragraphs based on line breaks and spacing."""
         # Split on double newlines or significant whitespace
-        paragraphs = re.split(r'\n\s*\n', text)
+        paragraphs = _PARA_SPLIT_RE.split(text)
         
         result = []
         for para in paragraphs:
@@ -261,23 +495,11 @@ class PDFDocumentParser:
     def _is_likely_heading(self, text: str) -> bool:
         """Check if text is likely a heading based on patterns."""
         text = text.strip()
-        
-        # Check Chinese patterns
-        for pattern, _ in self.CHINESE_HEADING_PATTERNS:
-            if pattern.match(text):
-                return True
-        
-        # Check numbered patterns
-        for pattern, _ in self.NUMBERED_HEADING_PATTERNS:
-            if pattern.match(text):
-                return True
-        
-        return False
+        return _may_start_heading(text) and self._HEADING_RE.match(text) is not None
 
     def _detect_heading(
         self, 
-        text: str, 
-        page: pdfplumber.page.Page
+        text: str
     ) -> Optional[tuple[HeadingLevel, Optional[str], str]]:
         """
         Detect if text is a heading and extract its components.
@@ -286,26 +508,25 @@ class PDFDocumentParser:
             Tuple of (level, number, title) if heading, None otherwise.
         """
         text = text.strip()
-        if not text or len(text) > 200:  # Headings are typically short
+        if len(text) > 200 or not _may_start_heading(text):  # Headings are short
+            return None
+        
+        match = self._HEADING_RE.match(text)
+        if match is None:
             return None
         
-        # Check Chinese heading patterns
-        for pattern, level in self.CHINESE_HEADING_PATTERNS:
-            match = pattern.match(text)
-            if match:
-                number = match.group(0)
-                title = text[len(number):].strip() or text
-                return (level, number, title)
+        group = match.lastindex
+        level, numbered = self._HEADING_BRANCHES[group]
         
-        # Check numbered heading patterns
-        for pattern, level in self.NUMBERED_HEADING_PATTERNS:
-            match = pattern.match(text)
-            if match:
-                number = match.group(1)
-                title = match.group(2).strip() if len(match.groups()) > 1 else text
-                return (level, number, title or text)
+        if not numbered:
+            # Chinese headings: the whole marker is the number
+            number = match.group(group)
+            title = text[len(number):].strip() or text
+            return (level, number, title)
         
-        return None
+        number = match.group(group + 1)
+        title = match.group(group + 2).strip()
+        return (level, number, title or text)
 
     def _create_section(
         self,
@@ -316,7 +537,7 @@ class PDFDocumentParser:
     ) -> DocumentSection:
         """Create a new DocumentSection."""
         return DocumentSection(
-            id=str(uuid.uuid4()),
+            id=new_id(),
             title=title,
             number=number,
             level=level,
@@ -334,7 +555,7 @@ class PDFDocumentParser:
         language = detect_language(text)
         
         return TextSegment(
-            id=str(uuid.uuid4()),
+            id=new_id(),
             content=text,
             start_pos=start_pos,
             end_pos=end_pos,
@@ -1,11 +1,40 @@
 """Serialization and deserialization utilities for parsed documents."""
 
 import json
-from typing import Any
+import sys
+from typing import Any, Union
 
 from ..models.document import DocumentSection, ParsedDocument, TextSegment
 from ..models.enums import DocumentType, HeadingLevel
 
+try:  # Optional accelerator for JSON encoding and decoding
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+
+def _dumps(data: dict[str, Any]) -> str:
+    """Encode data as indented JSON, keeping non-ASCII text as is."""
+    if orjson is not None:
+        return orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode("utf-8")
+    return json.dumps(data, ensure_ascii=False, indent=2)
+
+
+def _dumps_compact(data: dict[str, Any]) -> bytes:
+    """Encode data as UTF-8 JSON without any insignificant whitespace."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(json_str: Union[str, bytes]) -> Any:
+    """Decode JSON; orjson's decode error subclasses json.JSONDecodeError."""
+    if orjson is not None:
+        return orjson.loads(json_str)
+    return json.loads(json_str)
+
 
 class DocumentSerializer:
     """
@@ -16,21 +45,22 @@ class DocumentSerializer:
     """
 
     @staticmethod
-    def serialize(doc: ParsedDocument) -> str:
+    def serialize(doc: ParsedDocument, columnar: bool = False) -> str:
         """
         Serialize a ParsedDocument to JSON string.
         
         Args:
             doc: The ParsedDocument to serialize.
+            columnar: Store each section's segments as parallel per-field
+                lists instead of one object per segment. This avoids
+                repeating the field names for every segment, which makes
+                payloads of large documents smaller and faster to load.
+                deserialize() accepts either layout.
             
         Returns:
             JSON string representation of the document.
         """
-        return json.dumps(
-            DocumentSerializer._doc_to_dict(doc),
-            ensure_ascii=False,
-            indent=2
-        )
+        return _dumps(DocumentSerializer._doc_to_dict(doc, columnar))
 
     @staticmethod
     def deserialize(json_str: str) -> ParsedDocument:
@@ -47,20 +77,60 @@ class DocumentSerializer:
             ValueError: If the JSON is invalid or malformed.
         """
         try:
-            data = json.loads(json_str)
+            data = _loads(json_str)
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON: {str(e)}")
         
         return DocumentSerializer._dict_to_doc(data)
 
     @staticmethod
-    def _doc_to_dict(doc: ParsedDocument) -> dict[str, Any]:
+    def serialize_binary(doc: ParsedDocument) -> bytes:
+        """
+        Serialize a ParsedDocument to a compact byte payload for caching.
+        
+        The payload is UTF-8 JSON in the columnar layout with no
+        indentation, which is considerably smaller and faster to load
+        than the output of serialize().
+        
+        Args:
+            doc: The ParsedDocument to serialize.
+            
+        Returns:
+            Encoded document bytes.
+        """
+        return _dumps_compact(DocumentSerializer._doc_to_dict(doc, columnar=True))
+
+    @staticmethod
+    def deserialize_binary(data: bytes) -> ParsedDocument:
+        """
+        Deserialize bytes produced by serialize_binary() to a ParsedDocument.
+        
+        Args:
+            data: Encoded document bytes.
+            
+        Returns:
+            ParsedDocument reconstructed from the payload.
+            
+        Raises:
+            ValueError: If the payload is invalid or malformed.
+        """
+        try:
+            decoded = _loads(data)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            raise ValueError(f"Invalid document payload: {str(e)}")
+        
+        return DocumentSerializer._dict_to_doc(decoded)
+
+    @staticmethod
+    def _doc_to_dict(doc: ParsedDocument, columnar: bool = False) -> dict[str, Any]:
         """Convert ParsedDocument to dictionary."""
         return {
             "id": doc.id,
             "filename": doc.filename,
             "doc_type": doc.doc_type.value,
-            "sections": [DocumentSerializer._section_to_dict(s) for s in doc.sections],
+            "sections": [
+                DocumentSerializer._section_to_dict(s, columnar) for s in doc.sections
+            ],
             "metadata": doc.metadata,
             "raw_text": doc.raw_text,
         }
@@ -81,23 +151,54 @@ class DocumentSerializer:
             filename=data["filename"],
             doc_type=DocumentType(data["doc_type"]),
             sections=[DocumentSerializer._dict_to_section(s) for s in data.get("sections", [])],
-            metadata=data.get("metadata", {}),
+            metadata=data.get("metadata") or {},
             raw_text=data.get("raw_text", ""),
         )
 
     @staticmethod
-    def _section_to_dict(section: DocumentSection) -> dict[str, Any]:
+    def _section_to_dict(section: DocumentSection, columnar: bool = False) -> dict[str, Any]:
         """Convert DocumentSection to dictionary."""
+        if columnar:
+            segments = DocumentSerializer._segments_to_columns(section.segments)
+        else:
+            # Dict literal inline: one method call per segment is a measurable
+            # share of serialization time for large documents
+            segments = [
+                {
+                    "id": s.id,
+                    "content": s.content,
+                    "start_pos": s.start_pos,
+                    "end_pos": s.end_pos,
+                    "language": s.language,
+                    "formatting": s.formatting,
+                }
+                for s in section.segments
+            ]
+        
         return {
             "id": section.id,
             "title": section.title,
             "number": section.number,
             "level": section.level.value,
-            "segments": [DocumentSerializer._segment_to_dict(s) for s in section.segments],
-            "children": [DocumentSerializer._section_to_dict(c) for c in section.children],
+            "segments": segments,
+            "children": [
+                DocumentSerializer._section_to_dict(c, columnar) for c in section.children
+            ],
             "parent_id": section.parent_id,
         }
 
+    @staticmethod
+    def _segments_to_columns(segments: list[TextSegment]) -> dict[str, list]:
+        """Convert TextSegments to parallel per-field lists."""
+        return {
+            "id": [s.id for s in segments],
+            "content": [s.content for s in segments],
+            "start_pos": [s.start_pos for s in segments],
+            "end_pos": [s.end_pos for s in segments],
+            "language": [s.language for s in segments],
+            "formatting": [s.formatting for s in segments],
+        }
+
     @staticmethod
     def _dict_to_section(data: dict[str, Any]) -> DocumentSection:
         """Convert dictionary to DocumentSection."""
@@ -112,22 +213,40 @@ class DocumentSerializer:
             title=data.get("title"),
             number=data.get("number"),
             level=HeadingLevel(data.get("level", HeadingLevel.PARAGRAPH.value)),
-            segments=[DocumentSerializer._dict_to_segment(s) for s in data.get("segments", [])],
+            segments=DocumentSerializer._load_segments(data.get("segments", [])),
             children=[DocumentSerializer._dict_to_section(c) for c in data.get("children", [])],
             parent_id=data.get("parent_id"),
         )
 
     @staticmethod
-    def _segment_to_dict(segment: TextSegment) -> dict[str, Any]:
-        """Convert TextSegment to dictionary."""
-        return {
-            "id": segment.id,
-            "content": segment.content,
-            "start_pos": segment.start_pos,
-            "end_pos": segment.end_pos,
-            "language": segment.language,
-            "formatting": segment.formatting,
-        }
+    def _load_segments(data: Any) -> list[TextSegment]:
+        """Convert serialized segments, in either layout, to TextSegments."""
+        if not isinstance(data, dict):
+            return [DocumentSerializer._dict_to_segment(s) for s in data]
+        
+        required_fields = ["id", "content", "start_pos", "end_pos", "language"]
+        for field in required_fields:
+            if field not in data:
+                raise ValueError(f"Missing required field '{field}' in TextSegment columns")
+        
+        count = len(data["id"])
+        formatting = data.get("formatting") or [None] * count
+        columns = [data[field] for field in required_fields] + [formatting]
+        if any(len(column) != count for column in columns):
+            raise ValueError("TextSegment columns have mismatched lengths")
+        
+        intern = sys.intern
+        return [
+            TextSegment(
+                id=seg_id,
+                content=content,
+                start_pos=start_pos,
+                end_pos=end_pos,
+                language=intern(language) if isinstance(language, str) else language,
+                formatting=fmt or {},
+            )
+            for seg_id, content, start_pos, end_pos, language, fmt in zip(*columns)
+        ]
 
     @staticmethod
     def _dict_to_segment(data: dict[str, Any]) -> TextSegment:
@@ -140,19 +259,25 @@ class DocumentSerializer:
             if field not in data:
                 raise ValueError(f"Missing required field '{field}' in TextSegment")
         
+        # Every segment carries one of a handful of language codes; share
+        # one string object per code instead of one per decoded segment
+        language = data["language"]
+        if isinstance(language, str):
+            language = sys.intern(language)
+        
         return TextSegment(
             id=data["id"],
             content=data["content"],
             start_pos=data["start_pos"],
             end_pos=data["end_pos"],
-            language=data["language"],
-            formatting=data.get("formatting", {}),
+            language=language,
+            formatting=data.get("formatting") or {},
         )
 
 
-def serialize_document(doc: ParsedDocument) -> str:
+def serialize_document(doc: ParsedDocument, columnar: bool = False) -> str:
     """Convenience function to serialize a ParsedDocument."""
-    return DocumentSerializer.serialize(doc)
+    return DocumentSerializer.serialize(doc, columnar)
 
 
 def deserialize_document(json_str: str) -> ParsedDocument:
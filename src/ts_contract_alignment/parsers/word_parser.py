@@ -1,7 +1,7 @@
 """Word document (.docx) parser implementation."""
 
 import re
-import uuid
+import sys
 from pathlib import Path
 from typing import Optional
 from zipfile import BadZipFile
@@ -14,8 +14,15 @@ from docx.text.paragraph import Paragraph
 from ..models.document import DocumentSection, ParsedDocument, TextSegment
 from ..models.enums import DocumentType, HeadingLevel
 from .exceptions import DocumentCorruptedError, ParseError, UnsupportedFormatError
+from .headings import combine_heading_patterns
+from ..ids import new_id
 from .language_detector import detect_language
 
+_ENGLISH_WORD_RE = re.compile(r'[a-zA-Z]+')
+# Matched as runs: summing run lengths allocates one string per run rather
+# than one per character, which dominates on Chinese documents
+_CHINESE_RUN_RE = re.compile(r'[\u4e00-\u9fff]+')
+
 
 class WordDocumentParser:
     """
@@ -43,13 +50,21 @@ class WordDocumentParser:
         (re.compile(r'^[（(][0-9]+[)）]'), HeadingLevel.PARAGRAPH),
     ]
 
-    # Numbered heading patterns
+    # Numbered heading patterns, most specific first: the chapter pattern
+    # also matches the start of "1.2" and "1.2.3"
     NUMBERED_HEADING_PATTERNS = [
-        (re.compile(r'^(\d+)\s*[.、]?\s*(.*)'), HeadingLevel.CHAPTER),
-        (re.compile(r'^(\d+\.\d+)\s*[.、]?\s*(.*)'), HeadingLevel.SECTION),
         (re.compile(r'^(\d+\.\d+\.\d+)\s*[.、]?\s*(.*)'), HeadingLevel.SUBSECTION),
+        (re.compile(r'^(\d+\.\d+)\s*[.、]?\s*(.*)'), HeadingLevel.SECTION),
+        (re.compile(r'^(\d+)\s*[.、]?\s*(.*)'), HeadingLevel.CHAPTER),
     ]
 
+    # All heading patterns as one regex; match.lastindex identifies the
+    # branch. Chinese headings never start with a digit, so their relative
+    # order against the numbered patterns does not change which one wins.
+    _HEADING_RE, _HEADING_BRANCHES = combine_heading_patterns(
+        CHINESE_HEADING_PATTERNS + NUMBERED_HEADING_PATTERNS
+    )
+
     def __init__(self):
         self._current_position = 0
 
@@ -98,17 +113,22 @@ class WordDocumentParser:
 
         self._current_position = 0
         
+        # python-docx rebuilds the paragraph list, and Paragraph.text walks
+        # the runs' XML, on every access; read both once for all helpers
+        paragraphs = doc.paragraphs
+        texts = [para.text for para in paragraphs]
+        
         # Extract all text for raw_text
-        raw_text = self._extract_raw_text(doc)
+        raw_text = self._extract_raw_text(texts)
         
         # Parse sections with hierarchy
-        sections = self._parse_sections(doc)
+        sections = self._parse_sections(paragraphs, texts)
         
         # Build metadata
-        metadata = self._extract_metadata(doc, path)
+        metadata = self._extract_metadata(doc, path, texts, raw_text)
         
         return ParsedDocument(
-            id=str(uuid.uuid4()),
+            id=new_id(),
             filename=path.name,
             doc_type=DocumentType.WORD,
             sections=sections,
@@ -116,22 +136,21 @@ class WordDocumentParser:
             raw_text=raw_text
         )
 
-    def _extract_raw_text(self, doc: Document) -> str:
-        """Extract all text content from the document."""
-        paragraphs = []
-        for para in doc.paragraphs:
-            if para.text.strip():
-                paragraphs.append(para.text)
-        return "\n".join(paragraphs)
+    def _extract_raw_text(self, texts: list[str]) -> str:
+        """Join the text of all non-blank paragraphs."""
+        return "\n".join(text for text in texts if text.strip())
 
-    def _extract_metadata(self, doc: Document, path: Path) -> dict:
+    def _extract_metadata(
+        self, doc: Document, path: Path, texts: list[str], raw_text: str
+    ) -> dict:
         """Extract document metadata."""
         core_props = doc.core_properties
+        word_count = self._count_words(raw_text)
         
         metadata = {
-            "page_count": self._estimate_page_count(doc),
-            "word_count": self._count_words(doc),
-            "paragraph_count": len(doc.paragraphs),
+            "page_count": self._estimate_page_count(word_count),
+            "word_count": word_count,
+            "paragraph_count": len(texts),
             "file_size": path.stat().st_size if path.exists() else 0,
         }
         
@@ -147,36 +166,33 @@ class WordDocumentParser:
             
         return metadata
 
-    def _estimate_page_count(self, doc: Document) -> int:
+    def _estimate_page_count(self, word_count: int) -> int:
         """Estimate page count based on content."""
         # Rough estimate: ~500 words per page
-        word_count = self._count_words(doc)
         return max(1, word_count // 500 + 1)
 
-    def _count_words(self, doc: Document) -> int:
-        """Count total words in the document."""
-        total = 0
-        for para in doc.paragraphs:
-            # Count both English words and Chinese characters
-            text = para.text
-            # English words
-            english_words = len(re.findall(r'[a-zA-Z]+', text))
-            # Chinese characters (each counts as a word)
-            chinese_chars = len(re.findall(r'[\u4e00-\u9fff]', text))
-            total += english_words + chinese_chars
-        return total
+    def _count_words(self, raw_text: str) -> int:
+        """Count total words in the joined document text."""
+        # English words plus Chinese characters (each counts as a word);
+        # paragraphs are newline-joined, so no word spans a boundary
+        english_words = len(_ENGLISH_WORD_RE.findall(raw_text))
+        chinese_chars = sum(map(len, _CHINESE_RUN_RE.findall(raw_text)))
+        return english_words + chinese_chars
 
-    def _parse_sections(self, doc: Document) -> list[DocumentSection]:
-        """Parse document into hierarchical sections."""
+    def _parse_sections(
+        self, paragraphs: list[Paragraph], texts: list[str]
+    ) -> list[DocumentSection]:
+        """Parse paragraphs, with their pre-read texts, into hierarchical sections."""
         sections = []
         current_section_stack: list[DocumentSection] = []
         pending_segments: list[TextSegment] = []
         
-        for para in doc.paragraphs:
-            if not para.text.strip():
+        for para, text in zip(paragraphs, texts):
+            stripped = text.strip()
+            if not stripped:
                 continue
             
-            heading_level = self._detect_heading_level(para)
+            heading_level = self._detect_heading_level(para, stripped)
             
             if heading_level is not None:
                 # Save pending segments to current section
@@ -195,9 +211,9 @@ class WordDocumentParser:
                     pending_segments = []
                 
                 # Create new section
-                number, title = self._extract_number_and_title(para.text)
+                number, title = self._extract_number_and_title(stripped)
                 new_section = self._create_section(
-                    title=title or para.text.strip(),
+                    title=title or stripped,
                     number=number,
                     level=heading_level
                 )
@@ -215,7 +231,7 @@ class WordDocumentParser:
                 current_section_stack.append(new_section)
             else:
                 # Regular paragraph - create text segment
-                segment = self._create_text_segment(para)
+                segment = self._create_text_segment(para, text)
                 pending_segments.append(segment)
         
         # Handle remaining segments
@@ -233,50 +249,49 @@ class WordDocumentParser:
         
         return sections
 
-    def _detect_heading_level(self, para: Paragraph) -> Optional[HeadingLevel]:
-        """Detect if a paragraph is a heading and its level."""
+    def _detect_heading_level(
+        self, para: Paragraph, text: str
+    ) -> Optional[HeadingLevel]:
+        """Detect if a paragraph, with stripped text ``text``, is a heading and its level."""
         # Check Word style
-        style_name = para.style.name if para.style else None
+        style = para.style
+        style_name = style.name if style else None
         if style_name in self.HEADING_STYLE_MAP:
             return self.HEADING_STYLE_MAP[style_name]
         
-        text = para.text.strip()
         if not text:
             return None
         
-        # Check Chinese heading patterns
-        for pattern, level in self.CHINESE_HEADING_PATTERNS:
-            if pattern.match(text):
-                return level
-        
-        # Check numbered heading patterns
-        for pattern, level in self.NUMBERED_HEADING_PATTERNS:
-            if pattern.match(text):
-                return level
+        # Check Chinese and numbered heading patterns
+        match = self._HEADING_RE.match(text)
+        if match is not None:
+            return self._HEADING_BRANCHES[match.lastindex][0]
         
         # Check if paragraph has heading-like formatting
-        if self._has_heading_formatting(para):
+        if self._has_heading_formatting(para, text):
             return HeadingLevel.SECTION
         
         return None
 
-    def _has_heading_formatting(self, para: Paragraph) -> bool:
+    def _has_heading_formatting(self, para: Paragraph, text: str) -> bool:
         """Check if paragraph has heading-like formatting (bold, larger font)."""
-        if not para.runs:
+        # Paragraph.runs and Run.font build new proxy objects on every access
+        runs = para.runs
+        if not runs:
             return False
         
         # Check if entire paragraph is bold
-        all_bold = all(run.bold for run in para.runs if run.text.strip())
+        all_bold = all(run.bold for run in runs if run.text.strip())
         
         # Check font size (headings typically > 12pt)
         has_large_font = False
-        for run in para.runs:
-            if run.font.size and run.font.size.pt > 12:
+        for run in runs:
+            size = run.font.size
+            if size and size.pt > 12:
                 has_large_font = True
                 break
         
         # Short text that's bold or has large font is likely a heading
-        text = para.text.strip()
         is_short = len(text) < 100
         
         return is_short and (all_bold or has_large_font)
@@ -285,23 +300,21 @@ class WordDocumentParser:
         """Extract section number and title from heading text."""
         text = text.strip()
         
-        # Try numbered patterns first
-        for pattern, _ in self.NUMBERED_HEADING_PATTERNS:
-            match = pattern.match(text)
-            if match:
-                number = match.group(1)
-                title = match.group(2).strip() if len(match.groups()) > 1 else None
-                return number, title
+        match = self._HEADING_RE.match(text)
+        if match is None:
+            return None, text
+        
+        group = match.lastindex
+        _, numbered = self._HEADING_BRANCHES[group]
         
-        # Try Chinese patterns
-        for pattern, _ in self.CHINESE_HEADING_PATTERNS:
-            match = pattern.match(text)
-            if match:
-                number = match.group(0)
-                title = text[len(number):].strip()
-                return number, title or None
+        if numbered:
+            # Numbered headings capture the number and the title
+            return match.group(group + 1), match.group(group + 2).strip()
         
-        return None, text
+        # Chinese headings: the whole marker is the number
+        number = match.group(group)
+        title = text[len(number):].strip()
+        return number, title or None
 
     def _create_section(
         self,
@@ -312,7 +325,7 @@ class WordDocumentParser:
     ) -> DocumentSection:
         """Create a new DocumentSection."""
         return DocumentSection(
-            id=str(uuid.uuid4()),
+            id=new_id(),
             title=title,
             number=number,
             level=level,
@@ -321,9 +334,8 @@ class WordDocumentParser:
             parent_id=None
         )
 
-    def _create_text_segment(self, para: Paragraph) -> TextSegment:
-        """Create a TextSegment from a paragraph."""
-        text = para.text
+    def _create_text_segment(self, para: Paragraph, text: str) -> TextSegment:
+        """Create a TextSegment from a paragraph and its text."""
         start_pos = self._current_position
         end_pos = start_pos + len(text)
         self._current_position = end_pos + 1  # +1 for newline
@@ -332,7 +344,7 @@ class WordDocumentParser:
         language = detect_language(text)
         
         return TextSegment(
-            id=str(uuid.uuid4()),
+            id=new_id(),
             content=text,
             start_pos=start_pos,
             end_pos=end_pos,
@@ -351,16 +363,20 @@ class WordDocumentParser:
             "alignment": str(para.alignment) if para.alignment else "LEFT",
         }
         
-        if para.runs:
+        runs = para.runs
+        if runs:
             # Use first run's formatting as representative
-            first_run = para.runs[0]
+            first_run = runs[0]
             formatting["bold"] = bool(first_run.bold)
             formatting["italic"] = bool(first_run.italic)
             formatting["underline"] = bool(first_run.underline)
             
-            if first_run.font.size:
-                formatting["font_size"] = first_run.font.size.pt
-            if first_run.font.name:
-                formatting["font_name"] = first_run.font.name
+            font = first_run.font
+            size, name = font.size, font.name
+            if size:
+                formatting["font_size"] = size.pt
+            if name:
+                # Font names repeat across nearly every segment; share one copy
+                formatting["font_name"] = sys.intern(name)
         
         return formatting
@@ -259,6 +259,7 @@ class DatabaseOptimizer:
                 "CREATE INDEX IF NOT EXISTS idx_audit_events_document_id ON audit_events(document_id)",
                 "CREATE INDEX IF NOT EXISTS idx_audit_events_timestamp ON audit_events(timestamp)",
                 "CREATE INDEX IF NOT EXISTS idx_audit_events_event_type ON audit_events(event_type)",
+                "CREATE INDEX IF NOT EXISTS idx_audit_events_doc_type_ts ON audit_events(document_id, event_type, timestamp)",
             ]
             
             for index_sql in standard_indexes:
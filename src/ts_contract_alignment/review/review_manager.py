@@ -50,9 +50,8 @@ class ReviewManager(IReviewInterface):
             ReviewSession with all modifications as review items.
         """
         # Create review items from modifications
-        items = []
-        for mod in contract.modifications:
-            item = ReviewItem(
+        items = [
+            ReviewItem(
                 modification_id=mod.id,
                 ts_term_id=mod.source_ts_paragraph_id,
                 clause_id=mod.match_id,
@@ -62,7 +61,8 @@ class ReviewManager(IReviewInterface):
                 action=ReviewAction.PENDING,
                 user_comment=None,
             )
-            items.append(item)
+            for mod in contract.modifications
+        ]
 
         # Create session
         session_id = str(uuid.uuid4())
@@ -161,10 +161,6 @@ class ReviewManager(IReviewInterface):
             
             # Commit changes to database
             db.commit()
-            
-            # Recalculate completed_count for the return value
-            # (Note: completed_count is calculated dynamically in get_session)
-            completed_count = sum(1 for item in items if item["action"] != ReviewAction.PENDING.value)
 
             return updated_item
 
@@ -245,7 +241,6 @@ class ReviewManager(IReviewInterface):
                 id=str(session_model.id),
                 contract_id=str(session_model.contract_id),
                 items=items,
-                completed_count=sum(1 for item in items if item.action != ReviewAction.PENDING),
-                total_count=len(items),
+                # completed_count and total_count are derived from items
                 session_timestamp=session_model.session_timestamp.isoformat(),
             )
@@ -136,6 +136,47 @@ class TestRuleBasedMatcher:
         categories = matcher.get_expected_clause_categories(TermCategory.BOARD_SEATS)
         assert ClauseCategory.GOVERNANCE in categories
 
+    def test_keyword_index_matches_linear_scan(self):
+        """Test matching with the keyword index gives the same candidates."""
+        matcher = RuleBasedMatcher()
+        
+        term = ExtractedTerm(
+            id="term_001",
+            category=TermCategory.BOARD_SEATS,
+            title="Board Composition",
+            value="3 seats",
+            raw_text="The Investor may appoint one director to the Board",
+            source_section_id="sec_001",
+            source_paragraph_id="para_001",
+            confidence=0.9,
+            metadata={}
+        )
+        
+        clauses = [
+            AnalyzedClause(
+                id=f"clause_{i}",
+                section_id=f"sec_{i}",
+                title=title,
+                category=ClauseCategory.GOVERNANCE,
+                full_text="Matters reserved to the shareholders.",
+                keywords=keywords,
+            )
+            for i, (title, keywords) in enumerate([
+                ("Directors", ["Board", "director", "board"]),
+                ("Shareholder Meetings", ["quorum", "notice"]),
+            ])
+        ]
+        template_result = TemplateAnalysisResult(
+            document_id="template_doc_001",
+            clauses=clauses,
+        )
+        
+        assert template_result.keyword_index["board"] == [0, 0]
+        assert template_result.keyword_index["quorum"] == [1]
+        assert matcher.match(
+            term, clauses, template_result.keyword_index
+        ) == matcher.match(term, clauses)
+
 
 class TestSemanticMatcher:
     """Tests for the SemanticMatcher class."""
@@ -191,6 +232,12 @@ class TestSemanticMatcher:
         vec2 = [-1.0, 0.0, 0.0]
         assert matcher._cosine_similarity(vec1, vec2) == pytest.approx(-1.0)
 
+        # A precomputed norm for the first vector gives the same result
+        vec1 = [3.0, 4.0, 0.0]
+        vec2 = [4.0, 3.0, 0.0]
+        assert matcher._cosine_similarity(vec1, vec2, 5.0) == pytest.approx(0.96)
+        assert matcher._cosine_similarity(vec1, vec2) == pytest.approx(0.96)
+
     def test_set_similarity_threshold(self):
         """Test setting similarity threshold."""
         matcher = SemanticMatcher()
@@ -4,6 +4,7 @@ import uuid
 from datetime import datetime
 
 import pytest
+from docx import Document
 
 from ts_contract_alignment.generators import (
     ContractGenerator,
@@ -15,6 +16,7 @@ from ts_contract_alignment.generators import (
     ConflictResolution,
     DocumentExporter,
 )
+from ts_contract_alignment.generators.paragraph_index import ParagraphIndex
 from ts_contract_alignment.interfaces.generator import GeneratedContract, Modification
 from ts_contract_alignment.models.alignment import AlignmentMatch, AlignmentResult
 from ts_contract_alignment.models.document import (
@@ -32,6 +34,21 @@ from ts_contract_alignment.models.enums import (
 from ts_contract_alignment.models.extraction import ExtractedTerm, TSExtractionResult
 
 
+def _make_mod(mod_id, original, new, action, start, end=None):
+    """Build a Modification covering ``original`` unless ``end`` is given."""
+    return Modification(
+        id=mod_id,
+        match_id=f"match_{mod_id}",
+        original_text=original,
+        new_text=new,
+        location_start=start,
+        location_end=start + len(original) if end is None else end,
+        action=action,
+        source_ts_paragraph_id="ts_para_001",
+        confidence=0.9,
+    )
+
+
 class TestContractGenerator:
     """Tests for ContractGenerator class."""
 
@@ -196,6 +213,38 @@ class TestContractGenerator:
 
         assert len(contract.modifications) == 0
 
+    def test_generate_locates_nested_clause(
+        self, generator, sample_template_doc, sample_alignment_result, sample_ts_result
+    ):
+        """Test that matches targeting a child section resolve its content."""
+        sample_template_doc.sections[0].children.append(
+            DocumentSection(
+                id="sec_001_1",
+                title="Closing",
+                number="1.1",
+                level=HeadingLevel.SUBSECTION,
+                segments=[
+                    TextSegment(
+                        id="seg_002",
+                        content="Closing shall occur on [DATE].",
+                        start_pos=60,
+                        end_pos=90,
+                        language="en",
+                    )
+                ],
+                parent_id="sec_001",
+            )
+        )
+        sample_alignment_result.matches[0].clause_id = "sec_001_1"
+
+        contract = generator.generate(
+            sample_template_doc, sample_alignment_result, sample_ts_result
+        )
+
+        mod = contract.modifications[0]
+        assert mod.original_text == "Closing shall occur on [DATE]."
+        assert (mod.location_start, mod.location_end) == (60, 90)
+
     def test_generate_sets_file_paths(
         self, generator, sample_template_doc, sample_alignment_result, sample_ts_result
     ):
@@ -208,6 +257,321 @@ class TestContractGenerator:
         assert contract.clean_version_path.endswith("_clean.docx")
 
 
+class TestApplyModifications:
+    """Tests for applying modifications to a Word document."""
+
+    @pytest.fixture
+    def template_path(self, tmp_path):
+        """Create a small template .docx file."""
+        doc = Document()
+        doc.add_paragraph("Article 1 The investment amount is [AMOUNT].")
+        doc.add_paragraph("Article 2 The valuation is [VALUATION].")
+        doc.add_paragraph("Article 3 Governing law.")
+        path = tmp_path / "template.docx"
+        doc.save(str(path))
+        return str(path)
+
+    def test_apply_modifications_clean(self, tmp_path, template_path):
+        """Test overrides, in-paragraph inserts and fallback inserts."""
+        generator = ContractGenerator(output_dir=str(tmp_path))
+        mods = [
+            _make_mod("m1", "[AMOUNT]", "USD 1,000,000.00", ActionType.OVERRIDE, 10),
+            _make_mod("m2", "[VALUATION]", "USD 9,000,000.00", ActionType.OVERRIDE, 50),
+            _make_mod("m3", "Governing law.", "PRC law applies.", ActionType.INSERT, 90),
+            _make_mod("m4", "Missing clause", "New clause.", ActionType.INSERT, 120),
+        ]
+
+        doc = generator.apply_modifications_to_document(
+            template_path, mods, with_annotations=False
+        )
+
+        texts = [p.text for p in doc.paragraphs]
+        assert texts == [
+            "Article 1 The investment amount is USD 1,000,000.00.",
+            "Article 2 The valuation is USD 9,000,000.00.",
+            "Article 3 Governing law. PRC law applies.",
+            "New clause.",
+        ]
+        assert generator.get_conflicts() == []
+
+    def test_override_preserves_run_formatting(self, tmp_path):
+        """Test an override inside one run keeps the other runs intact."""
+        doc = Document()
+        para = doc.add_paragraph()
+        para.add_run("Amount: ").bold = True
+        para.add_run("[AMOUNT]")
+        para.add_run(" payable at closing.").italic = True
+        path = tmp_path / "runs.docx"
+        doc.save(str(path))
+
+        generator = ContractGenerator(output_dir=str(tmp_path))
+        mods = [_make_mod("m1", "[AMOUNT]", "USD 5.00", ActionType.OVERRIDE, 8)]
+        result = generator.apply_modifications_to_document(
+            str(path), mods, with_annotations=False
+        )
+
+        runs = result.paragraphs[0].runs
+        assert [r.text for r in runs] == ["Amount: ", "USD 5.00", " payable at closing."]
+        assert runs[0].bold is True
+        assert runs[2].italic is True
+
+    def test_override_spanning_runs_rebuilds_paragraph(self, tmp_path):
+        """Test an override split across runs falls back to a rebuild."""
+        doc = Document()
+        para = doc.add_paragraph()
+        para.add_run("Amount: [AMO")
+        para.add_run("UNT] due.")
+        path = tmp_path / "split.docx"
+        doc.save(str(path))
+
+        generator = ContractGenerator(output_dir=str(tmp_path))
+        mods = [_make_mod("m1", "[AMOUNT]", "USD 5.00", ActionType.OVERRIDE, 8)]
+        result = generator.apply_modifications_to_document(
+            str(path), mods, with_annotations=False
+        )
+
+        assert result.paragraphs[0].text == "Amount: USD 5.00 due."
+
+    @pytest.mark.parametrize("parallel", [True, False])
+    def test_export_both_versions(self, tmp_path, template_path, parallel):
+        """Test both versions are written whether or not built in parallel."""
+        generator = ContractGenerator(output_dir=str(tmp_path), parallel_export=parallel)
+        contract = GeneratedContract(
+            id="contract_001",
+            template_document_id="template_001",
+            ts_document_id="ts_001",
+            modifications=[
+                _make_mod("m1", "[AMOUNT]", "USD 1,000,000.00", ActionType.OVERRIDE, 10),
+            ],
+            revision_tracked_path=str(tmp_path / "out_tracked.docx"),
+            clean_version_path=str(tmp_path / "out_clean.docx"),
+        )
+
+        revision_path, clean_path = generator.export_both_versions(contract, template_path)
+
+        assert revision_path == contract.revision_tracked_path
+        assert clean_path == contract.clean_version_path
+        clean_doc = Document(clean_path)
+        assert clean_doc.paragraphs[0].text == (
+            "Article 1 The investment amount is USD 1,000,000.00."
+        )
+        tracked_doc = Document(revision_path)
+        assert tracked_doc.paragraphs[0].text == (
+            "Article 1 The investment amount is USD 1,000,000.00."
+            " [TS:ts_para_001] [OVERRIDE] [Conf:0.90]"
+        )
+
+
+class TestDocumentExporter:
+    """Tests for DocumentExporter class."""
+
+    @pytest.fixture
+    def exporter(self, tmp_path):
+        """Create a DocumentExporter instance."""
+        return DocumentExporter(output_dir=str(tmp_path))
+
+    @pytest.fixture
+    def template_path(self, tmp_path):
+        """Create a small template .docx file."""
+        doc = Document()
+        doc.add_paragraph("The investment amount is [AMOUNT].")
+        doc.add_paragraph("The valuation is [VALUATION].")
+        path = tmp_path / "template.docx"
+        doc.save(str(path))
+        return str(path)
+
+    @pytest.fixture
+    def contract(self, tmp_path):
+        """Create a generated contract with an override and two inserts."""
+        return GeneratedContract(
+            id="contract_0001",
+            template_document_id="template_001",
+            ts_document_id="ts_001",
+            modifications=[
+                _make_mod("m1", "[AMOUNT]", "USD 100.00", ActionType.OVERRIDE, 25),
+                _make_mod("m2", "valuation", "(post-money)", ActionType.INSERT, 40),
+                _make_mod("m3", "Not present", "Extra clause.", ActionType.INSERT, 80),
+            ],
+            revision_tracked_path=str(tmp_path / "out" / "tracked.docx"),
+            clean_version_path=str(tmp_path / "out" / "clean.docx"),
+            generation_timestamp="2024-01-01T00:00:00",
+        )
+
+    def test_export_clean_version(self, exporter, contract, template_path):
+        """Test the clean export applies every modification."""
+        path = exporter.export_clean_version(contract, template_path)
+
+        texts = [p.text for p in Document(path).paragraphs]
+        assert texts == [
+            "The investment amount is USD 100.00.",
+            "The valuation is [VALUATION]. (post-money)",
+            "Extra clause.",
+        ]
+
+    def test_export_revision_tracked(self, exporter, contract, template_path):
+        """Test the tracked export annotates every modification."""
+        path = exporter.export_revision_tracked(contract, template_path)
+
+        texts = [p.text for p in Document(path).paragraphs]
+        assert len(texts) == 3
+        assert "USD 100.00" in texts[0]
+        assert "(post-money)" in texts[1]
+        assert texts[2].startswith("Extra clause.")
+        assert all("【TS:ts_para_001 | " in text for text in texts)
+
+    def test_export_clean_version_from_loaded_document(
+        self, exporter, contract, template_path
+    ):
+        """Test exports accept an already loaded Document."""
+        path = exporter.export_clean_version(contract, Document(template_path))
+
+        assert Document(path).paragraphs[0].text == "The investment amount is USD 100.00."
+
+    def test_tracked_override_keeps_surrounding_runs(self, exporter, contract, tmp_path):
+        """Test a tracked override only splits the run holding the original."""
+        doc = Document()
+        para = doc.add_paragraph()
+        para.add_run("Amount: ").bold = True
+        para.add_run("due [AMOUNT] now")
+        path = tmp_path / "runs.docx"
+        doc.save(str(path))
+        contract.modifications = contract.modifications[:1]
+
+        result = Document(exporter.export_revision_tracked(contract, str(path)))
+
+        runs = result.paragraphs[0].runs
+        assert [r.text for r in runs[:5]] == [
+            "Amount: ", "due ", "[AMOUNT]", "USD 100.00", " now",
+        ]
+        assert runs[0].bold is True
+        assert runs[2].font.strike is True
+        assert runs[3].font.strike is not True
+        assert runs[3].font.highlight_color is not None
+        assert runs[4].font.highlight_color is None
+
+    def test_tracked_override_spanning_runs_keeps_surrounding_text(
+        self, exporter, contract, tmp_path
+    ):
+        """Test a tracked override split across runs keeps the rest of the paragraph."""
+        doc = Document()
+        para = doc.add_paragraph()
+        para.add_run("Amount: [AMO").bold = True
+        para.add_run("UNT] due [AMOUNT].")
+        path = tmp_path / "split.docx"
+        doc.save(str(path))
+        contract.modifications = contract.modifications[:1]
+
+        result = Document(exporter.export_revision_tracked(contract, str(path)))
+
+        runs = result.paragraphs[0].runs
+        assert [r.text for r in runs[:7]] == [
+            "Amount: ", "[AMOUNT]", "USD 100.00", " due ", "[AMOUNT]", "USD 100.00", ".",
+        ]
+        assert runs[0].bold is True
+        assert runs[1].font.strike is True
+        assert runs[2].font.highlight_color is not None
+        assert runs[7].text.startswith(" 【TS:ts_para_001 | OVERRIDE")
+
+    def test_clean_override_spanning_runs_keeps_first_run_format(
+        self, exporter, contract, tmp_path
+    ):
+        """Test rebuilding a paragraph reapplies the first run's formatting."""
+        doc = Document()
+        para = doc.add_paragraph()
+        para.add_run("due [AMO").italic = True
+        para.add_run("UNT] now")
+        path = tmp_path / "split.docx"
+        doc.save(str(path))
+        contract.modifications = contract.modifications[:1]
+
+        result = Document(exporter.export_clean_version(contract, str(path)))
+
+        runs = result.paragraphs[0].runs
+        assert [r.text for r in runs] == ["due USD 100.00 now"]
+        assert runs[0].italic is True
+        assert runs[0].bold is None
+
+    @pytest.mark.parametrize("parallel", [True, False])
+    def test_export_both_versions(self, tmp_path, contract, template_path, parallel):
+        """Test exporting both versions matches the individual exports."""
+        exporter = DocumentExporter(output_dir=str(tmp_path), parallel_export=parallel)
+        revision_path, clean_path = exporter.export_both_versions(contract, template_path)
+
+        assert revision_path == contract.revision_tracked_path
+        assert clean_path == contract.clean_version_path
+        assert [p.text for p in Document(clean_path).paragraphs] == [
+            "The investment amount is USD 100.00.",
+            "The valuation is [VALUATION]. (post-money)",
+            "Extra clause.",
+        ]
+        assert len(Document(revision_path).paragraphs) == 3
+
+    def test_export_diff_report(self, exporter, contract, tmp_path):
+        """Test the exported diff report matches the generated report."""
+        path = exporter.export_diff_report(contract, str(tmp_path / "reports" / "diff.txt"))
+
+        with open(path, encoding="utf-8") as f:
+            content = f.read()
+        report = exporter.generate_diff_report(contract)
+        assert content == report + "\n"
+        assert "Total Modifications: 3" in report
+        assert "Insertions: 2" in report
+        assert "Overrides: 1" in report
+
+    def test_diff_report_truncates_long_text(self, exporter, contract):
+        """Test long modification text is cut to 100 characters."""
+        contract.modifications[0].original_text = "x" * 100
+        contract.modifications[0].new_text = "y" * 101
+
+        lines = exporter.generate_diff_report(contract).splitlines()
+
+        assert f"  Original: {'x' * 100}" in lines
+        assert f"  New: {'y' * 100}..." in lines
+
+
+class TestParagraphIndex:
+    """Tests for ParagraphIndex lookups."""
+
+    def test_find_tracks_edited_and_appended_paragraphs(self):
+        """Test lookups reflect edits made after the index was built."""
+        doc = Document()
+        doc.add_paragraph("alpha beta")
+        doc.add_paragraph("gamma beta")
+        index = ParagraphIndex(doc.paragraphs, ["beta", "gamma", "delta"])
+
+        assert index.find("beta") == 0
+        assert index.find("delta") is None
+        assert index.find("") is None
+
+        index.paragraphs[0].text = "alpha"
+        index.refresh(0)
+        assert index.find("beta") == 1
+
+        index.paragraphs[0].text = "alpha delta"
+        index.refresh(0)
+        assert index.find("delta") == 0
+
+        index.append(doc.add_paragraph("epsilon"))
+        assert index.find("epsilon") == 2
+
+    def test_rebind_tracks_copies_independently(self):
+        """Test a rebound index shares hits but not edits."""
+        first, second = Document(), Document()
+        for doc in (first, second):
+            doc.add_paragraph("alpha beta")
+            doc.add_paragraph("gamma beta")
+        index = ParagraphIndex(first.paragraphs, ["beta"])
+        copy_index = index.rebind(second.paragraphs)
+
+        copy_index.paragraphs[0].text = "alpha"
+        copy_index.refresh(0)
+        assert copy_index.find("beta") == 1
+        assert index.find("beta") == 0
+
+        with pytest.raises(ValueError):
+            copy_index.rebind(first.paragraphs)
+
+
 class TestAnnotationManager:
     """Tests for AnnotationManager class."""
 
@@ -317,6 +681,47 @@ class TestConflictHandler:
         assert conflict is not None
         assert conflict.conflict_type == ConflictType.LOCATION_NOT_FOUND
 
+    def test_detect_location_not_found_batch(self, handler, sample_modification):
+        """Test batch detection only flags modifications whose text is missing."""
+        missing = Modification(
+            id="mod_002",
+            match_id="match_002",
+            original_text="Absent text",
+            new_text="Replacement",
+            location_start=20,
+            location_end=31,
+            action=ActionType.OVERRIDE,
+            source_ts_paragraph_id="ts_para_002",
+            confidence=0.8,
+        )
+
+        results = handler.detect_location_not_found_batch(
+            [sample_modification, missing], "Here is the Original text of the clause."
+        )
+
+        assert results[0] is None
+        assert results[1] is not None
+        assert results[1].modification_id == "mod_002"
+        assert results[1].conflict_type == ConflictType.LOCATION_NOT_FOUND
+        assert results[1].description_str == (
+            "Target text not found in document: 'Absent text...'"
+        )
+
+    def test_detect_overlapping_modification(self, handler, sample_modification):
+        """Test overlap detection treats ranges as half-open."""
+        adjacent = _make_mod("mod_adjacent", "text", "new", ActionType.OVERRIDE, 13, end=20)
+        overlapping = _make_mod("mod_overlap", "text", "new", ActionType.OVERRIDE, 10, end=20)
+
+        assert handler.detect_overlapping_modification(
+            sample_modification, [adjacent]
+        ) is None
+        conflict = handler.detect_overlapping_modification(
+            sample_modification, [adjacent, overlapping]
+        )
+        assert conflict is not None
+        assert conflict.conflict_type == ConflictType.OVERLAPPING_MODIFICATION
+        assert "mod_overlap" in conflict.description_str
+
     def test_resolve_conflict_preserve_original(self, handler, sample_modification):
         """Test resolving conflict by preserving original."""
         original = {"bold": True}
@@ -329,6 +734,22 @@ class TestConflictHandler:
         resolved = handler.resolve_conflict(conflict)
         assert resolved == original
 
+    def test_resolve_conflict_merge(self, handler, sample_modification):
+        """Test merging dict and string values."""
+        conflict = handler.detect_formatting_conflict(
+            {"bold": True, "italic": False}, {"bold": False}, sample_modification
+        )
+        assert handler.resolve_conflict(conflict, ConflictResolution.MERGE) == {
+            "bold": False,
+            "italic": False,
+        }
+
+        conflict = handler.detect_location_not_found(sample_modification, "Other text")
+        assert (
+            handler.resolve_conflict(conflict, ConflictResolution.MERGE)
+            == "Original text New text"
+        )
+
     def test_get_conflicts_by_type(self, handler, sample_modification):
         """Test getting conflicts by type."""
         handler.detect_formatting_conflict(
@@ -338,6 +759,24 @@ class TestConflictHandler:
         conflicts = handler.get_conflicts_by_type(ConflictType.FORMATTING_MISMATCH)
         assert len(conflicts) == 1
 
+    def test_get_conflicts_returns_immutable_copy(self, handler, sample_modification):
+        """Test get_conflicts is an immutable copy and snapshot is mutable."""
+        assert handler.get_conflicts() == ()
+        handler.detect_formatting_conflict(
+            {"bold": True}, {"bold": False}, sample_modification
+        )
+
+        conflicts = handler.get_conflicts()
+        assert len(conflicts) == 1
+        assert conflicts[0].conflict_type == ConflictType.FORMATTING_MISMATCH
+        assert not hasattr(conflicts, "append")
+
+        snapshot = handler.snapshot()
+        snapshot.append(snapshot[0])
+        handler.clear_conflicts()
+        assert len(conflicts) == 1
+        assert handler.get_conflicts() == ()
+
     def test_export_conflict_report(self, handler, sample_modification):
         """Test exporting conflict report."""
         handler.detect_formatting_conflict(
@@ -348,6 +787,45 @@ class TestConflictHandler:
         assert report["total_conflicts"] == 1
         assert "by_type" in report
 
+    def test_export_conflict_report_counts(self, handler, sample_modification):
+        """Test report aggregates stay in sync with recorded conflicts."""
+        handler.detect_formatting_conflict(
+            {"bold": True}, {"bold": False}, sample_modification
+        )
+        handler.detect_location_not_found(sample_modification, "Unrelated text")
+
+        report = handler.export_conflict_report()
+        assert report["by_type"]["formatting_mismatch"] == 1
+        assert report["by_type"]["location_not_found"] == 1
+        assert report["by_type"]["style_conflict"] == 0
+        assert report["requiring_review"] == 1
+
+        assert [c["conflict_type"] for c in report["conflicts"]] == [
+            "formatting_mismatch",
+            "location_not_found",
+        ]
+
+        handler.clear_conflicts()
+        report = handler.export_conflict_report()
+        assert report["total_conflicts"] == 0
+        assert report["conflicts"] == []
+        assert report["requiring_review"] == 0
+        assert all(count == 0 for count in report["by_type"].values())
+
+    def test_export_conflict_report_returns_fresh_dicts(
+        self, handler, sample_modification
+    ):
+        """Test editing one report does not leak into the next."""
+        handler.detect_formatting_conflict(
+            {"bold": True}, {"bold": False}, sample_modification
+        )
+
+        first = handler.export_conflict_report()
+        first["conflicts"][0]["original_value"] = "[redacted]"
+        second = handler.export_conflict_report()
+
+        assert second["conflicts"][0]["original_value"] == "{'bold': True}"
+
 
 class TestModification:
     """Tests for Modification dataclass."""
@@ -0,0 +1,146 @@
+"""Unit tests for the DocumentParser facade."""
+
+import multiprocessing
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from docx import Document
+
+from ts_contract_alignment.models.enums import HeadingLevel
+from ts_contract_alignment.parsers.base import DocumentParser
+from ts_contract_alignment.parsers.exceptions import UnsupportedFormatError
+from ts_contract_alignment.ids import new_id
+from ts_contract_alignment.parsers.word_parser import WordDocumentParser
+
+
+@pytest.fixture
+def docx_files(tmp_path):
+    """Create a few small Word documents with distinct content."""
+    paths = []
+    for i in range(3):
+        doc = Document()
+        doc.add_heading(f"Section {i}", level=1)
+        doc.add_paragraph(f"Investment amount {i}")
+        path = tmp_path / f"doc_{i}.docx"
+        doc.save(str(path))
+        paths.append(str(path))
+    return paths
+
+
+class TestParseBatch:
+    """Tests for DocumentParser.parse_batch."""
+
+    @pytest.mark.parametrize("num_workers", [1, 2])
+    def test_preserves_input_order(self, docx_files, num_workers):
+        """Test results match sequential parsing, in input order."""
+        parser = DocumentParser()
+
+        docs = parser.parse_batch(docx_files, num_workers=num_workers)
+
+        assert [d.filename for d in docs] == ["doc_0.docx", "doc_1.docx", "doc_2.docx"]
+        assert [d.raw_text for d in docs] == [
+            parser.parse(path).raw_text for path in docx_files
+        ]
+
+    def test_empty_batch(self):
+        """Test an empty batch returns no documents."""
+        assert DocumentParser().parse_batch([]) == []
+
+    def test_propagates_errors(self, docx_files, tmp_path):
+        """Test a failing file raises the same error as parse."""
+        bad = tmp_path / "notes.txt"
+        bad.write_text("not a contract")
+
+        with pytest.raises(UnsupportedFormatError):
+            DocumentParser().parse_batch(docx_files + [str(bad)], num_workers=2)
+
+
+class TestNumberedHeadings:
+    """Tests for heading detection in Word documents."""
+
+    def test_multi_level_numbers(self, tmp_path):
+        """Test dotted numbers nest as sections and subsections."""
+        doc = Document()
+        for text in ["1 Investment", "1.1 Amount", "1.1.1 Tranches", "Paid in cash."]:
+            doc.add_paragraph(text)
+        path = tmp_path / "numbered.docx"
+        doc.save(str(path))
+
+        parsed = DocumentParser().parse(str(path))
+
+        chapter = parsed.sections[0]
+        section = chapter.children[0]
+        subsection = section.children[0]
+        assert (chapter.number, section.number, subsection.number) == ("1", "1.1", "1.1.1")
+        assert subsection.title == "Tranches"
+        assert subsection.segments[0].content == "Paid in cash."
+
+    @pytest.mark.parametrize(
+        "text, level, number, title",
+        [
+            ("第一章 总则", HeadingLevel.CHAPTER, "第一章", "总则"),
+            ("第三条 投资金额", HeadingLevel.SECTION, "第三条", "投资金额"),
+            ("二、交割条件", HeadingLevel.SECTION, "二、", "交割条件"),
+            ("(一)", HeadingLevel.SUBSECTION, "(一)", None),
+            ("（2）优先权", HeadingLevel.PARAGRAPH, "（2）", "优先权"),
+            ("2.1 Amount", HeadingLevel.SECTION, "2.1", "Amount"),
+            ("3、Closing", HeadingLevel.CHAPTER, "3", "Closing"),
+        ],
+    )
+    def test_combined_pattern_dispatch(self, text, level, number, title):
+        """Test one combined regex yields the level, number and title."""
+        parser = WordDocumentParser()
+        paragraph = Document().add_paragraph(text)
+
+        assert parser._detect_heading_level(paragraph, text) == level
+        assert parser._extract_number_and_title(text) == (number, title)
+
+    def test_body_text_is_not_numbered(self):
+        """Test plain text keeps no number and its full text as title."""
+        parser = WordDocumentParser()
+
+        assert parser._extract_number_and_title(" Paid in cash. ") == (None, "Paid in cash.")
+
+
+class TestWordMetadata:
+    """Tests for Word document metadata."""
+
+    def test_word_count_mixes_english_and_chinese(self, tmp_path):
+        """Test English words and Chinese characters are counted per paragraph."""
+        doc = Document()
+        for text in ["Series A", "", "投资金额 USD", "Amount"]:
+            doc.add_paragraph(text)
+        path = tmp_path / "counts.docx"
+        doc.save(str(path))
+
+        metadata = DocumentParser().parse(str(path)).metadata
+
+        assert metadata["word_count"] == 8
+        assert metadata["paragraph_count"] == 4
+        assert metadata["page_count"] == 1
+
+
+class TestNewId:
+    """Tests for batched identifier generation."""
+
+    def test_unique_uuid4_strings(self):
+        """Test identifiers are distinct, well-formed UUID4 strings."""
+        ids = [new_id() for _ in range(1000)]
+
+        assert len(set(ids)) == len(ids)
+        assert all(uuid.UUID(i).version == 4 and str(uuid.UUID(i)) == i for i in ids)
+
+    def test_forked_worker_draws_fresh_ids(self):
+        """Test a forked process does not reuse the parent's pooled ids."""
+        new_id()  # make sure the parent holds a partly used batch
+        context = multiprocessing.get_context("fork")
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            child_ids = set(executor.submit(_draw_ids, 50).result())
+
+        assert child_ids.isdisjoint(_draw_ids(50))
+
+
+def _draw_ids(count):
+    """Draw identifiers in a worker process."""
+    return [new_id() for _ in range(count)]
@@ -0,0 +1,49 @@
+"""Unit tests for the language detection utilities."""
+
+import pytest
+
+from ts_contract_alignment.parsers.language_detector import (
+    detect_language,
+    segment_by_language,
+)
+
+
+class TestDetectLanguage:
+    """Tests for detect_language."""
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("", "en"),
+            ("   ", "en"),
+            ("1,000,000 - 2024", "en"),
+            ("The investment amount shall be paid.", "en"),
+            ("本轮投资金额为人民币壹仟万元整", "zh"),
+            ("投资方有权 Rights", "mixed"),
+            ("优先股 Series A Preferred Shares", "en"),
+            ("Ａ轮投资金额", "zh"),
+        ],
+    )
+    def test_detect_language(self, text, expected):
+        """Test classification by Chinese/English character ratio."""
+        assert detect_language(text) == expected
+
+
+class TestSegmentByLanguage:
+    """Tests for segment_by_language."""
+
+    def test_segments_alternating_languages(self):
+        """Test text splits at Chinese/English boundaries."""
+        assert segment_by_language("投资金额 Investment Amount 为一千万") == [
+            ("投资金额", "zh"),
+            (" Investment Amount ", "en"),
+            ("为一千万", "zh"),
+        ]
+
+    def test_drops_whitespace_between_chinese_runs(self):
+        """Test blank chunks between Chinese runs are not emitted."""
+        assert segment_by_language("甲方 乙方") == [("甲方", "zh"), ("乙方", "zh")]
+
+    def test_empty_text(self):
+        """Test empty text yields no segments."""
+        assert segment_by_language("") == []
@@ -0,0 +1,310 @@
+"""Unit tests for the PDF document parser."""
+
+from types import SimpleNamespace
+
+import pytest
+from pdfminer.psparser import LIT
+
+from ts_contract_alignment.models.enums import HeadingLevel
+from ts_contract_alignment.parsers.exceptions import DocumentCorruptedError
+from ts_contract_alignment.parsers.pdf_parser import (
+    PDFDocumentParser,
+    _page_may_have_text,
+)
+
+
+def _write_pdf(path, pages):
+    """Write a minimal PDF with one Helvetica text line per entry.
+
+    A page given as bytes is used as its raw content stream instead.
+    """
+    page_count = len(pages)
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids ["
+        + b" ".join(b"%d 0 R" % (4 + 2 * i) for i in range(page_count))
+        + b"] /Count %d >>" % page_count,
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for i, lines in enumerate(pages):
+        if isinstance(lines, bytes):  # Raw content stream
+            stream = lines
+        else:
+            stream = b"BT /F1 12 Tf 14 TL 72 720 Td " + b" ".join(
+                b"(%s) Tj T*" % line.encode("ascii") for line in lines
+            ) + b" ET"
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (5 + 2 * i)
+        )
+        objects.append(
+            b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream)
+        )
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1, xref
+    )
+    path.write_bytes(bytes(out))
+
+
+def _outline(sections):
+    """Reduce sections to comparable (number, title, contents, children)."""
+    return [
+        (
+            s.number,
+            s.title,
+            [seg.content for seg in s.segments],
+            _outline(s.children),
+        )
+        for s in sections
+    ]
+
+
+@pytest.fixture
+def long_pdf(tmp_path):
+    """Create a PDF long enough to use parallel page extraction."""
+    path = tmp_path / "contract.pdf"
+    _write_pdf(
+        path,
+        [
+            [f"{i + 1}. Article {i + 1}", f"The Investor shall pay tranche {i + 1}."]
+            for i in range(10)
+        ],
+    )
+    return str(path)
+
+
+class TestPDFDocumentParser:
+    """Tests for PDFDocumentParser."""
+
+    def test_parallel_extraction_matches_sequential(self, long_pdf):
+        """Test page workers produce the same document as in-process parsing."""
+        sequential = PDFDocumentParser(page_workers=1).parse(long_pdf)
+        parallel = PDFDocumentParser(page_workers=3).parse(long_pdf)
+
+        assert parallel.raw_text == sequential.raw_text
+        assert parallel.metadata == sequential.metadata
+        assert _outline(parallel.sections) == _outline(sequential.sections)
+
+    def test_parses_pages_in_order(self, long_pdf):
+        """Test sections and metadata are built from every page in order."""
+        doc = PDFDocumentParser(page_workers=3).parse(long_pdf)
+
+        assert doc.metadata["page_count"] == 10
+        assert [s.number for s in doc.sections] == [str(i) for i in range(1, 11)]
+        assert doc.sections[3].segments[0].content == "The Investor shall pay tranche 4."
+        assert doc.sections[3].segments[0].formatting["page_number"] == 4
+
+    def test_default_parser_extracts_in_process(self, long_pdf, monkeypatch):
+        """Test page workers are opt-in: the default never starts a pool."""
+        def fail(*args, **kwargs):
+            raise AssertionError("process pool started")
+
+        monkeypatch.setattr(
+            "ts_contract_alignment.parsers.pdf_parser.ProcessPoolExecutor", fail
+        )
+
+        assert PDFDocumentParser().parse(long_pdf).metadata["page_count"] == 10
+
+    def test_pdfium_backend_matches_pdfplumber(self, long_pdf):
+        """Test the PDFium backend builds the same document on plain text."""
+        plumber = PDFDocumentParser(page_workers=1).parse(long_pdf)
+        pdfium = PDFDocumentParser(text_backend="pdfium").parse(long_pdf)
+
+        assert pdfium.raw_text == plumber.raw_text
+        assert pdfium.metadata == plumber.metadata
+        assert _outline(pdfium.sections) == _outline(plumber.sections)
+
+    def test_unknown_text_backend(self):
+        """Test an unsupported backend name is rejected."""
+        with pytest.raises(ValueError):
+            PDFDocumentParser(text_backend="fitz")
+
+    def test_segment_offsets_index_raw_text(self, long_pdf):
+        """Test every segment's offsets slice its content out of raw_text."""
+        doc = PDFDocumentParser(page_workers=1).parse(long_pdf)
+
+        segments = [seg for section in doc.iter_sections() for seg in section.segments]
+        assert len(segments) == 10
+        for seg in segments:
+            assert doc.raw_text[seg.start_pos:seg.end_pos] == seg.content
+        assert doc.raw_text.startswith("1. Article 1\nThe Investor shall pay tranche 1.\n")
+
+    @pytest.mark.parametrize(
+        "content",
+        [b"not a pdf at all", b"%PDF-1.4\n1 0 obj\n<<>>\nendobj\n"],
+    )
+    def test_corrupted_file(self, tmp_path, content):
+        """Test unreadable PDFs raise DocumentCorruptedError."""
+        path = tmp_path / "broken.pdf"
+        path.write_bytes(content)
+
+        with pytest.raises(DocumentCorruptedError):
+            PDFDocumentParser().parse(str(path))
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("第一章 总则", (HeadingLevel.CHAPTER, "第一章", "总则")),
+            ("第十二条 投资", (HeadingLevel.SECTION, "第十二条", "投资")),
+            ("(二)董事会", (HeadingLevel.SUBSECTION, "(二)", "董事会")),
+            ("（3）信息权", (HeadingLevel.PARAGRAPH, "（3）", "信息权")),
+            ("1. Definitions", (HeadingLevel.CHAPTER, "1", "Definitions")),
+            ("1.1 Investment", (HeadingLevel.SECTION, "1.1", "Investment")),
+            ("2.3.4 Closing", (HeadingLevel.SUBSECTION, "2.3.4", "Closing")),
+            ("12", (HeadingLevel.CHAPTER, "12", "12")),
+            ("１２ 附则", (HeadingLevel.CHAPTER, "１２", "附则")),
+            ("The Investor shall pay", None),
+        ],
+    )
+    def test_detect_heading(self, text, expected):
+        """Test the first matching heading pattern decides the result."""
+        parser = PDFDocumentParser()
+
+        assert parser._detect_heading(text) == expected
+        assert parser._is_likely_heading(text) is (expected is not None)
+
+
+class TestPDFParseCache:
+    """Tests for the content-hash parse cache."""
+
+    def test_reuses_cached_document(self, long_pdf, tmp_path):
+        """Test an unchanged file is loaded from the cache."""
+        cache_dir = tmp_path / "cache"
+        parser = PDFDocumentParser(page_workers=1, cache_dir=cache_dir)
+
+        first = parser.parse(long_pdf)
+        parser._parse_pdf = None  # a cache miss would now fail
+        second = parser.parse(long_pdf)
+
+        assert len(list(cache_dir.glob("*.json"))) == 1
+        assert second.raw_text == first.raw_text
+        assert _outline(second.sections) == _outline(first.sections)
+
+    def test_cached_document_gets_fresh_ids(self, tmp_path):
+        """Test a cache hit assigns new ids and keeps the section tree linked."""
+        path = tmp_path / "nested.pdf"
+        _write_pdf(path, [["1. Terms", "1.1 Price", "Body text."]])
+        parser = PDFDocumentParser(cache_dir=tmp_path / "cache")
+
+        first = parser.parse(str(path))
+        second = parser.parse(str(path))
+
+        def ids(doc):
+            sections = list(doc.iter_sections())
+            segments = [seg for section in sections for seg in section.segments]
+            return {doc.id} | {s.id for s in sections} | {s.id for s in segments}
+
+        assert not ids(first) & ids(second)
+        chapter, = second.sections
+        assert [c.parent_id for c in chapter.children] == [chapter.id]
+
+    def test_changed_contents_miss_the_cache(self, long_pdf, tmp_path):
+        """Test a modified file is parsed again under a new key."""
+        cache_dir = tmp_path / "cache"
+        parser = PDFDocumentParser(page_workers=1, cache_dir=cache_dir)
+        first = parser.parse(long_pdf)
+
+        _write_pdf(tmp_path / "contract.pdf", [["1. Amended Article"]])
+        second = parser.parse(long_pdf)
+
+        assert len(list(cache_dir.glob("*.json"))) == 2
+        assert second.id != first.id
+        assert second.sections[0].title == "Amended Article"
+
+    def test_corrupt_entry_is_replaced(self, long_pdf, tmp_path):
+        """Test an unreadable cache entry falls back to parsing."""
+        cache_dir = tmp_path / "cache"
+        parser = PDFDocumentParser(page_workers=1, cache_dir=cache_dir)
+        first = parser.parse(long_pdf)
+        entry = next(cache_dir.glob("*.json"))
+        entry.write_bytes(b"not a document")
+
+        second = parser.parse(long_pdf)
+
+        assert second.id != first.id
+        assert second.raw_text == first.raw_text
+        parser._parse_pdf = None  # the replaced entry must now be a hit
+        assert parser.parse(long_pdf).raw_text == second.raw_text
+
+    def test_parser_version_is_part_of_the_key(self, long_pdf, tmp_path, monkeypatch):
+        """Test entries written by an older parser version are not loaded."""
+        cache_dir = tmp_path / "cache"
+        parser = PDFDocumentParser(page_workers=1, cache_dir=cache_dir)
+        first = parser.parse(long_pdf)
+
+        monkeypatch.setattr(
+            "ts_contract_alignment.parsers.pdf_parser._CACHE_VERSION", 2
+        )
+        second = parser.parse(long_pdf)
+
+        assert second.id != first.id
+        assert len(list(cache_dir.glob("*.json"))) == 2
+        assert not list(cache_dir.glob("*.tmp"))
+
+
+class _FakeStream(dict):
+    """Stand-in for a pdfminer stream: attributes plus decoded data."""
+
+    def __init__(self, data=b"", **attrs):
+        super().__init__(**attrs)
+        self.data = data
+
+    def get_data(self):
+        return self.data
+
+
+def _fake_page(contents, xobjects=None):
+    """Build an object exposing the page_obj attributes the probe reads."""
+    resources = {"XObject": xobjects} if xobjects is not None else {}
+    return SimpleNamespace(
+        page_obj=SimpleNamespace(resources=resources, contents=contents)
+    )
+
+
+class TestTextProbe:
+    """Tests for skipping pages that cannot contain text."""
+
+    def test_image_only_page_is_skipped(self, tmp_path):
+        """Test a page without text operators yields no text and no segments."""
+        path = tmp_path / "scanned.pdf"
+        _write_pdf(path, [["1. Terms", "Body text."], b"q 100 0 0 100 0 0 cm Q"])
+
+        doc = PDFDocumentParser(page_workers=1).parse(str(path))
+
+        assert doc.metadata["page_count"] == 2
+        assert doc.raw_text == "1. Terms\nBody text."
+
+    @pytest.mark.parametrize(
+        "page, expected",
+        [
+            (_fake_page([_FakeStream(b"BT (x) Tj ET")]), True),
+            (_fake_page([_FakeStream(b"q /Im0 Do Q")]), False),
+            (
+                _fake_page(
+                    [_FakeStream(b"q /Im0 Do Q")],
+                    {"Im0": _FakeStream(Subtype=LIT("Image"))},
+                ),
+                False,
+            ),
+            (
+                _fake_page(
+                    [_FakeStream(b"q /Fm0 Do Q")],
+                    {"Fm0": _FakeStream(Subtype=LIT("Form"))},
+                ),
+                True,
+            ),
+            (SimpleNamespace(page_obj=None), True),
+        ],
+    )
+    def test_probe(self, page, expected):
+        """Test only pages that provably lack text are ruled out."""
+        assert _page_may_have_text(page) is expected
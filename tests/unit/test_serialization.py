@@ -0,0 +1,124 @@
+"""Unit tests for ParsedDocument serialization."""
+
+import json
+
+import pytest
+
+from ts_contract_alignment.models.document import (
+    DocumentSection,
+    ParsedDocument,
+    TextSegment,
+)
+from ts_contract_alignment.models.enums import DocumentType, HeadingLevel
+from ts_contract_alignment.parsers import serialization
+from ts_contract_alignment.parsers.serialization import (
+    DocumentSerializer,
+    deserialize_document,
+    serialize_document,
+)
+
+
+@pytest.fixture
+def document():
+    """Create a small document with a nested section."""
+    child = DocumentSection(
+        id="sec_002",
+        title=None,
+        number="1.1",
+        level=HeadingLevel.SUBSECTION,
+        segments=[
+            TextSegment(
+                id="seg_003",
+                content="投资金额",
+                start_pos=30,
+                end_pos=34,
+                language="zh",
+            ),
+        ],
+        parent_id="sec_001",
+    )
+    return ParsedDocument(
+        id="doc_001",
+        filename="ts.docx",
+        doc_type=DocumentType.WORD,
+        sections=[
+            DocumentSection(
+                id="sec_001",
+                title="Investment",
+                number="1",
+                level=HeadingLevel.SECTION,
+                segments=[
+                    TextSegment(
+                        id="seg_001",
+                        content="Investment Amount",
+                        start_pos=0,
+                        end_pos=17,
+                        language="en",
+                        formatting={"bold": True},
+                    ),
+                    TextSegment(
+                        id="seg_002",
+                        content="USD 10,000,000",
+                        start_pos=18,
+                        end_pos=29,
+                        language="en",
+                    ),
+                ],
+                children=[child],
+            ),
+        ],
+        metadata={"page_count": 1},
+        raw_text="Investment Amount\nUSD 10,000,000\n投资金额",
+    )
+
+
+class TestDocumentSerializer:
+    """Tests for DocumentSerializer."""
+
+    @pytest.mark.parametrize("columnar", [False, True])
+    def test_round_trip(self, document, columnar):
+        """Test both layouts deserialize to the original document."""
+        assert deserialize_document(serialize_document(document, columnar)) == document
+
+    def test_columnar_layout(self, document):
+        """Test columnar mode stores segments as parallel lists."""
+        data = json.loads(serialize_document(document, columnar=True))
+
+        segments = data["sections"][0]["segments"]
+        assert segments["id"] == ["seg_001", "seg_002"]
+        assert segments["formatting"] == [{"bold": True}, {}]
+        assert data["sections"][0]["children"][0]["segments"]["language"] == ["zh"]
+
+    def test_columnar_length_mismatch(self, document):
+        """Test mismatched segment columns are rejected."""
+        data = json.loads(serialize_document(document, columnar=True))
+        data["sections"][0]["segments"]["content"].pop()
+
+        with pytest.raises(ValueError):
+            DocumentSerializer.deserialize(json.dumps(data))
+
+    def test_stdlib_fallback_matches(self, document, monkeypatch):
+        """Test output is identical with and without the orjson accelerator."""
+        encoded = serialize_document(document)
+        monkeypatch.setattr(serialization, "orjson", None)
+
+        assert serialize_document(document) == encoded
+        assert deserialize_document(encoded) == document
+
+    def test_invalid_json(self):
+        """Test malformed input raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid JSON"):
+            deserialize_document("{not json")
+
+    def test_binary_round_trip(self, document):
+        """Test the compact cache payload round-trips and beats the text form."""
+        payload = DocumentSerializer.serialize_binary(document)
+
+        assert isinstance(payload, bytes)
+        assert len(payload) < len(serialize_document(document).encode("utf-8"))
+        assert DocumentSerializer.deserialize_binary(payload) == document
+
+    def test_invalid_binary_payload(self):
+        """Test corrupt payloads raise ValueError."""
+        with pytest.raises(ValueError):
+            DocumentSerializer.deserialize_binary(b"\xff\xfe")